@@ -0,0 +1,62 @@
+"""Fast JSON encoding for event and diagnostic payloads.
+
+Uses pydantic-core's Rust serializer, which is already a dependency via
+pydantic and natively handles datetimes, enums, and pydantic models.
+Payloads containing types it cannot serialize fall back to the stdlib
+encoder, stringifying unknown values.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from pydantic import BaseModel
+from pydantic_core import PydanticSerializationError, from_json, to_json
+
+
+def dumps(obj: Any) -> str:
+    """Serialize ``obj`` to a JSON string.
+
+    Args:
+        obj: Any JSON-compatible value, pydantic model, or container of them.
+
+    Returns:
+        The JSON document as ``str``.
+    """
+    try:
+        return to_json(obj).decode()
+    except PydanticSerializationError:
+        return json.dumps(obj, default=_default)
+
+
+def dumpb(obj: Any) -> bytes:
+    """Serialize ``obj`` to JSON-encoded ``bytes`` (e.g. a response body)."""
+    try:
+        return to_json(obj)
+    except PydanticSerializationError:
+        return json.dumps(obj, default=_default).encode()
+
+
+def dumps_model(model: BaseModel) -> str:
+    """Serialize a pydantic model with its class's compiled serializer.
+
+    Skips the type inference :func:`dumps` does on its argument; used for
+    the per-event SSE payloads.
+    """
+    try:
+        return model.__pydantic_serializer__.to_json(model).decode()
+    except PydanticSerializationError:
+        return dumps(model)
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse a JSON document."""
+    return from_json(data)
+
+
+def _default(obj: Any) -> Any:
+    """Stdlib ``default`` hook: unpack models, stringify everything else."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    return str(obj)
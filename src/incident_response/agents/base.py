@@ -15,10 +15,15 @@ from __future__ import annotations
 
 import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, Callable
+from collections import ChainMap
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
 import structlog
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
 logger = structlog.get_logger(__name__)
 
 
@@ -27,6 +32,10 @@ class BaseAgent(ABC):
 
     Every agent receives a shared ``context`` dict, performs work, and
     returns an updated copy of that context.
+
+    Sub-agents of a :class:`ParallelAgent` are the exception: they get a
+    read-only view of the context and must return only their own outputs
+    (the keys they add), which the parallel agent merges.
     """
 
     def __init__(self, name: str, description: str = "") -> None:
@@ -69,6 +78,8 @@ class LlmAgent(BaseAgent):
         self.instruction = instruction
         self.model = model
         self.tools = tools or []
+        # Bound on first run so it picks up the logging config set at startup
+        self._log: Any = None
 
     async def run(self, context: dict[str, Any]) -> dict[str, Any]:
         """Execute via heuristic fallback (no LLM API required).
@@ -76,12 +87,11 @@ class LlmAgent(BaseAgent):
         In a real ADK deployment the ``instruction`` would be sent to the
         configured model. Here we call :meth:`_heuristic_run` instead.
         """
-        logger.info(
-            "agent_running",
-            agent=self.name,
-            model=self.model,
-            mode="heuristic_fallback",
-        )
+        if self._log is None:
+            self._log = logger.bind(
+                agent=self.name, model=self.model, mode="heuristic_fallback"
+            )
+        self._log.info("agent_running")
         return await self._heuristic_run(context)
 
     async def _heuristic_run(self, context: dict[str, Any]) -> dict[str, Any]:
@@ -89,11 +99,26 @@ class LlmAgent(BaseAgent):
         return context
 
 
+class ContextView(ChainMap):  # type: ignore[type-arg]
+    """Copy-on-write view over an agent context.
+
+    Writes land in the top layer (``maps[0]``) while lookups fall through
+    to the caller's context, so wrapping a context is O(1) regardless of
+    its size. Call :meth:`commit` to flatten the layers into a plain dict.
+    """
+
+    def commit(self) -> dict[str, Any]:
+        """Flatten all layers into a new plain dict (top layer wins)."""
+        return dict(self)
+
+
 class SequentialAgent(BaseAgent):
     """Runs sub-agents in sequence, passing context through each one.
 
     Mirrors ``google.adk.agents.SequentialAgent``. The output context of
-    agent *N* becomes the input context of agent *N+1*.
+    agent *N* becomes the input context of agent *N+1*. Sub-agents write
+    into a :class:`ContextView` layered over the caller's context, which is
+    never mutated; the layers are flattened once on return.
     """
 
     def __init__(
@@ -104,28 +129,35 @@ class SequentialAgent(BaseAgent):
     ) -> None:
         super().__init__(name=name, description=description)
         self.sub_agents = sub_agents
+        self._sub_agent_names = tuple(a.name for a in sub_agents)
 
     async def run(self, context: dict[str, Any]) -> dict[str, Any]:
         """Execute sub-agents sequentially, threading context through."""
         logger.info(
             "sequential_agent_start",
             agent=self.name,
-            sub_agents=[a.name for a in self.sub_agents],
+            sub_agents=self._sub_agent_names,
         )
-        current_context = context.copy()
+        current_context: dict[str, Any] = ContextView({}, context)  # type: ignore[assignment]
         for agent in self.sub_agents:
             logger.debug("sequential_step", parent=self.name, child=agent.name)
             current_context = await agent.run(current_context)
         logger.info("sequential_agent_complete", agent=self.name)
-        return current_context
+        return _flatten(current_context)
 
 
 class ParallelAgent(BaseAgent):
     """Runs sub-agents concurrently, merging results into context.
 
-    Mirrors ``google.adk.agents.ParallelAgent``. All sub-agents receive
-    the same input context snapshot. Results are merged via dict update
-    in declaration order (later agents' keys win on conflict).
+    Mirrors ``google.adk.agents.ParallelAgent``. All sub-agents share one
+    read-only view of the input context (a :class:`types.MappingProxyType`),
+    so sub-agents must not mutate it and return only their outputs instead.
+    Results are merged as each sub-agent finishes.
+
+    If ``short_circuit`` is given it is called with the merged context after
+    every completed sub-agent; once it returns ``True`` the remaining
+    sub-agents are cancelled, each is recorded under ``errors``, and the
+    partial result is returned.
     """
 
     def __init__(
@@ -133,33 +165,59 @@ class ParallelAgent(BaseAgent):
         name: str,
         sub_agents: list[BaseAgent],
         description: str = "",
+        short_circuit: Callable[[dict[str, Any]], bool] | None = None,
     ) -> None:
         super().__init__(name=name, description=description)
         self.sub_agents = sub_agents
+        self._sub_agent_names = tuple(a.name for a in sub_agents)
+        self.short_circuit = short_circuit
 
     async def run(self, context: dict[str, Any]) -> dict[str, Any]:
-        """Execute sub-agents concurrently with asyncio.gather."""
+        """Execute sub-agents concurrently, merging results as they complete."""
         logger.info(
             "parallel_agent_start",
             agent=self.name,
-            sub_agents=[a.name for a in self.sub_agents],
+            sub_agents=self._sub_agent_names,
         )
-        # Each sub-agent gets the same snapshot
-        tasks = [agent.run(context.copy()) for agent in self.sub_agents]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Merge results into a combined context
+        # Each sub-agent gets the same read-only view (no per-agent copy)
+        shared = MappingProxyType(context)
         merged = context.copy()
-        for agent, result in zip(self.sub_agents, results):
-            if isinstance(result, Exception):
-                logger.error(
-                    "parallel_agent_error",
-                    agent=agent.name,
-                    error=str(result),
-                )
-                merged.setdefault("errors", {})[agent.name] = str(result)
-            else:
-                merged.update(result)
+
+        # _tagged never raises, so one failing sub-agent cannot abort the
+        # group; leaving the block waits for (or reaps cancelled) tasks.
+        async with asyncio.TaskGroup() as group:
+            tasks = [group.create_task(_tagged(agent, shared)) for agent in self.sub_agents]
+            for next_done in asyncio.as_completed(tasks):
+                agent, result = await next_done
+                if isinstance(result, BaseException):
+                    logger.error(
+                        "parallel_agent_error",
+                        agent=agent.name,
+                        error=str(result),
+                    )
+                    merged.setdefault("errors", {})[agent.name] = str(result)
+                else:
+                    merged.update(result)
+
+                if self.short_circuit is not None and self.short_circuit(merged):
+                    pending = [
+                        (task, sub_agent)
+                        for task, sub_agent in zip(tasks, self.sub_agents, strict=True)
+                        if not task.done()
+                    ]
+                    for task, sub_agent in pending:
+                        task.cancel()
+                        # Record what was dropped so the lost evidence is visible
+                        merged.setdefault("errors", {})[sub_agent.name] = (
+                            f"cancelled: short-circuited by {agent.name}"
+                        )
+                    logger.info(
+                        "parallel_agent_short_circuit",
+                        agent=self.name,
+                        trigger=agent.name,
+                        cancelled=len(pending),
+                    )
+                    break
 
         logger.info("parallel_agent_complete", agent=self.name)
         return merged
@@ -172,6 +230,9 @@ class LoopAgent(BaseAgent):
     sub-agent sequence runs. The loop exits when:
     - ``context["loop_complete"]`` is set to ``True``
     - ``max_iterations`` is reached
+
+    The caller's context is updated in place. Pass ``defensive_copy=True``
+    when the caller still needs its original context afterwards.
     """
 
     def __init__(
@@ -180,10 +241,13 @@ class LoopAgent(BaseAgent):
         sub_agents: list[BaseAgent],
         max_iterations: int = 3,
         description: str = "",
+        defensive_copy: bool = False,
     ) -> None:
         super().__init__(name=name, description=description)
         self.sub_agents = sub_agents
+        self._sub_agent_names = tuple(a.name for a in sub_agents)
         self.max_iterations = max_iterations
+        self.defensive_copy = defensive_copy
 
     async def run(self, context: dict[str, Any]) -> dict[str, Any]:
         """Execute sub-agents in a loop with escalation on each pass."""
@@ -191,20 +255,21 @@ class LoopAgent(BaseAgent):
             "loop_agent_start",
             agent=self.name,
             max_iterations=self.max_iterations,
-            sub_agents=[a.name for a in self.sub_agents],
+            sub_agents=self._sub_agent_names,
         )
 
-        current_context = context.copy()
+        current_context = dict(context) if self.defensive_copy else context
         current_context.setdefault("loop_iteration", 0)
         current_context.setdefault("loop_complete", False)
 
-        for iteration in range(self.max_iterations):
-            current_context["loop_iteration"] = iteration + 1
+        max_iterations = self.max_iterations
+        for iteration in range(1, max_iterations + 1):
+            current_context["loop_iteration"] = iteration
             logger.info(
                 "loop_iteration",
                 agent=self.name,
-                iteration=iteration + 1,
-                max_iterations=self.max_iterations,
+                iteration=iteration,
+                max_iterations=max_iterations,
             )
 
             for agent in self.sub_agents:
@@ -214,14 +279,14 @@ class LoopAgent(BaseAgent):
                 logger.info(
                     "loop_condition_met",
                     agent=self.name,
-                    iteration=iteration + 1,
+                    iteration=iteration,
                 )
                 break
         else:
             logger.warning(
                 "loop_max_iterations_reached",
                 agent=self.name,
-                max_iterations=self.max_iterations,
+                max_iterations=max_iterations,
             )
             current_context["loop_exhausted"] = True
 
@@ -231,3 +296,21 @@ class LoopAgent(BaseAgent):
             iterations=current_context["loop_iteration"],
         )
         return current_context
+
+
+def _flatten(context: Mapping[str, Any]) -> dict[str, Any]:
+    """Return ``context`` as a plain dict, committing a :class:`ContextView`."""
+    if isinstance(context, ContextView):
+        return context.commit()
+    return context  # type: ignore[return-value]
+
+
+async def _tagged(
+    agent: BaseAgent,
+    context: Mapping[str, Any],
+) -> tuple[BaseAgent, dict[str, Any] | Exception]:
+    """Run a sub-agent, pairing the outcome (or error) with the agent."""
+    try:
+        return agent, await agent.run(context)  # type: ignore[arg-type]
+    except Exception as exc:
+        return agent, exc
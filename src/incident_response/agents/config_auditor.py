@@ -7,6 +7,7 @@ and other Kubernetes deployment parameters.
 
 from __future__ import annotations
 
+import re
 from typing import Any
 
 import structlog
@@ -17,6 +18,24 @@ from incident_response.tools.infrastructure import check_config
 
 logger = structlog.get_logger(__name__)
 
+# Severity indicators emitted by this agent
+RESOURCE_LIMIT_DRIFT = "resource_limit_drift"
+IMAGE_VERSION_MISMATCH = "image_version_mismatch"
+ENV_VAR_DRIFT = "env_var_drift"
+CRITICAL_CONFIG_DRIFT = "critical_config_drift"
+
+# One scan per drift field; the lookahead also reports overlapping keywords
+_FIELD_SEV_RE = re.compile(
+    r"(?=(?P<memory>memory)|(?P<cpu>cpu)|(?P<image>image)|(?P<env>env))",
+    re.IGNORECASE,
+)
+_GROUP_TO_SEV = {
+    "memory": RESOURCE_LIMIT_DRIFT,
+    "cpu": RESOURCE_LIMIT_DRIFT,
+    "image": IMAGE_VERSION_MISMATCH,
+    "env": ENV_VAR_DRIFT,
+}
+
 
 class ConfigAuditorAgent(LlmAgent):
     """Audits service configuration for drift and misconfigurations.
@@ -46,8 +65,9 @@ class ConfigAuditorAgent(LlmAgent):
         Expects:
             context["alert"]: Alert instance
 
-        Sets:
-            context["config_diagnostics"]: DiagnosticResult instance
+        Returns:
+            Only this agent's output, ``{"config_diagnostics": DiagnosticResult}``;
+            the context is a read-only view under ParallelAgent.
         """
         alert = context["alert"]
         service = alert.service
@@ -57,19 +77,22 @@ class ConfigAuditorAgent(LlmAgent):
         # Check configuration drift
         config_data = await check_config(service)
 
+        status = config_data.get("status", "unknown")
+        if status == "compliant":
+            # Common healthy path: no drift items to walk
+            diagnostic = self._compliant_result(service, config_data)
+            logger.info(
+                "config_audit_complete", service=service, status=status, drift_count=0
+            )
+            return {"config_diagnostics": diagnostic}
+
         findings: list[str] = []
         anomalies: list[dict[str, Any]] = []
-        severity_indicators: list[str] = []
+        severity_indicators: set[str] = set()
 
-        status = config_data.get("status", "unknown")
         drifts = config_data.get("drifts", [])
 
-        if status == "compliant":
-            findings.append(
-                f"No configuration drift detected for {service}. "
-                "Running config matches declared GitOps state."
-            )
-        elif status == "drifted":
+        if status == "drifted":
             findings.append(
                 f"Configuration drift detected for {service}: "
                 f"{len(drifts)} drift item(s) found."
@@ -99,14 +122,10 @@ class ConfigAuditorAgent(LlmAgent):
                 })
 
                 # Map drift types to severity indicators
-                if "memory" in field.lower() or "cpu" in field.lower():
-                    severity_indicators.append("resource_limit_drift")
-                if "image" in field.lower():
-                    severity_indicators.append("image_version_mismatch")
-                if "env" in field.lower():
-                    severity_indicators.append("env_var_drift")
+                for match in _FIELD_SEV_RE.finditer(field):
+                    severity_indicators.add(_GROUP_TO_SEV[match.lastgroup])  # type: ignore[index]
                 if drift_severity == "critical":
-                    severity_indicators.append("critical_config_drift")
+                    severity_indicators.add(CRITICAL_CONFIG_DRIFT)
 
         else:
             findings.append(
@@ -117,16 +136,15 @@ class ConfigAuditorAgent(LlmAgent):
         last_sync = config_data.get("last_sync", "unknown")
         findings.append(f"Last GitOps sync: {last_sync}")
 
-        diagnostic = DiagnosticResult(
+        # Fields are built locally with the right types; skip re-validation
+        diagnostic = DiagnosticResult.model_construct(
             agent_name=self.name,
             findings=findings,
             anomalies=anomalies,
-            severity_indicators=list(set(severity_indicators)),
+            severity_indicators=sorted(severity_indicators),
             raw_data=config_data,
         )
 
-        context["config_diagnostics"] = diagnostic
-
         logger.info(
             "config_audit_complete",
             service=service,
@@ -134,4 +152,21 @@ class ConfigAuditorAgent(LlmAgent):
             drift_count=len(drifts),
         )
 
-        return context
+        return {"config_diagnostics": diagnostic}
+
+    def _compliant_result(
+        self, service: str, config_data: dict[str, Any]
+    ) -> DiagnosticResult:
+        """Build the no-drift result for a compliant ``service``."""
+        last_sync = config_data.get("last_sync", "unknown")
+        return DiagnosticResult.model_construct(
+            agent_name=self.name,
+            findings=[
+                f"No configuration drift detected for {service}. "
+                "Running config matches declared GitOps state.",
+                f"Last GitOps sync: {last_sync}",
+            ],
+            anomalies=[],
+            severity_indicators=[],
+            raw_data=config_data,
+        )
@@ -7,7 +7,8 @@ sequential triage pipeline.
 
 from __future__ import annotations
 
-from typing import Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
 import structlog
 
@@ -19,8 +20,58 @@ from incident_response.mock_data.infrastructure import (
 )
 from incident_response.models import Alert, IncidentContext
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
 logger = structlog.get_logger(__name__)
 
+# Known recurring incidents per service, built once and shared read-only
+_KNOWN_RECURRING: Mapping[str, tuple[Mapping[str, str], ...]] = MappingProxyType({
+    service: tuple(MappingProxyType(incident) for incident in incidents)
+    for service, incidents in {
+        "payment-service": [
+            {
+                "incident_id": "INC-2024-0847",
+                "title": "Payment service CPU spike during flash sale",
+                "severity": "P2",
+                "resolved_at": "2024-11-15T14:30:00Z",
+                "root_cause": "Thread pool exhaustion under high concurrency",
+                "resolution": "Increased thread pool size and added circuit breaker",
+            },
+        ],
+        "order-processor": [
+            {
+                "incident_id": "INC-2024-0923",
+                "title": "OOM kills after batch size increase",
+                "severity": "P1",
+                "resolved_at": "2024-12-01T08:15:00Z",
+                "root_cause": "Memory limit too low for new batch processing config",
+                "resolution": "Increased memory limit to 4Gi and reduced batch size",
+            },
+        ],
+        "api-gateway": [
+            {
+                "incident_id": "INC-2024-0956",
+                "title": "5xx cascade from payment-service outage",
+                "severity": "P1",
+                "resolved_at": "2024-12-10T16:45:00Z",
+                "root_cause": "Missing circuit breaker for payment-service upstream",
+                "resolution": "Added circuit breaker with 10-failure threshold",
+            },
+        ],
+        "db-proxy": [
+            {
+                "incident_id": "INC-2024-0891",
+                "title": "Connection pool exhaustion during peak",
+                "severity": "P2",
+                "resolved_at": "2024-11-28T11:20:00Z",
+                "root_cause": "Leaked connections from long-running queries",
+                "resolution": "Added connection timeout and query kill after 30s",
+            },
+        ],
+    }.items()
+})
+
 
 class ContextEnricherAgent(LlmAgent):
     """Enriches an alert with operational context from infrastructure sources.
@@ -49,6 +100,9 @@ class ContextEnricherAgent(LlmAgent):
 
         Sets:
             context["incident_context"]: IncidentContext model instance
+            context["_shared"]: read-only mapping with ``service_info``,
+                ``owner_team``, ``oncall`` and ``service_deps``, shared by
+                reference with every downstream agent; never mutate it
         """
         alert: Alert = context["alert"]
         service_name = alert.service
@@ -75,7 +129,7 @@ class ContextEnricherAgent(LlmAgent):
         # Build enriched context
         enriched_service_info = {
             **service_info,
-            "oncall": oncall_info,
+            "oncall": dict(oncall_info),
         }
 
         incident_context = IncidentContext(
@@ -87,8 +141,12 @@ class ContextEnricherAgent(LlmAgent):
         )
 
         context["incident_context"] = incident_context
-        context["owner_team"] = owner_team
-        context["service_info"] = enriched_service_info
+        context["_shared"] = MappingProxyType({
+            "service_info": enriched_service_info,
+            "owner_team": owner_team,
+            "oncall": oncall_info,
+            "service_deps": tuple(service_info.get("dependencies", ())),
+        })
 
         logger.info(
             "context_enriched",
@@ -102,7 +160,9 @@ class ContextEnricherAgent(LlmAgent):
         return context
 
 
-def _find_related_incidents(service: str, exclude_alert_id: str) -> list[dict[str, Any]]:
+def _find_related_incidents(
+    service: str, exclude_alert_id: str
+) -> list[dict[str, Any]]:
     """Find related historical incidents for the same service.
 
     In production this would query an incident management system like
@@ -111,53 +171,9 @@ def _find_related_incidents(service: str, exclude_alert_id: str) -> list[dict[st
     # Service dependency mapping for blast radius analysis
     service_deps = SERVICE_REGISTRY.get(service, {}).get("dependencies", [])
 
-    related: list[dict[str, Any]] = []
-
-    # Add a mock related incident if the service has known issues
-    known_recurring: dict[str, list[dict[str, Any]]] = {
-        "payment-service": [
-            {
-                "incident_id": "INC-2024-0847",
-                "title": "Payment service CPU spike during flash sale",
-                "severity": "P2",
-                "resolved_at": "2024-11-15T14:30:00Z",
-                "root_cause": "Thread pool exhaustion under high concurrency",
-                "resolution": "Increased thread pool size and added circuit breaker",
-            },
-        ],
-        "order-processor": [
-            {
-                "incident_id": "INC-2024-0923",
-                "title": "OOM kills after batch size increase",
-                "severity": "P1",
-                "resolved_at": "2024-12-01T08:15:00Z",
-                "root_cause": "Memory limit too low for new batch processing config",
-                "resolution": "Increased memory limit to 4Gi and reduced batch size",
-            },
-        ],
-        "api-gateway": [
-            {
-                "incident_id": "INC-2024-0956",
-                "title": "5xx cascade from payment-service outage",
-                "severity": "P1",
-                "resolved_at": "2024-12-10T16:45:00Z",
-                "root_cause": "Missing circuit breaker for payment-service upstream",
-                "resolution": "Added circuit breaker with 10-failure threshold",
-            },
-        ],
-        "db-proxy": [
-            {
-                "incident_id": "INC-2024-0891",
-                "title": "Connection pool exhaustion during peak",
-                "severity": "P2",
-                "resolved_at": "2024-11-28T11:20:00Z",
-                "root_cause": "Leaked connections from long-running queries",
-                "resolution": "Added connection timeout and query kill after 30s",
-            },
-        ],
-    }
-
-    related.extend(known_recurring.get(service, []))
+    # Add a mock related incident if the service has known issues; copied
+    # so the shared read-only table never ends up inside an IncidentContext
+    related = [dict(incident) for incident in _KNOWN_RECURRING.get(service, ())]
 
     # Note any affected dependencies
     if service_deps:
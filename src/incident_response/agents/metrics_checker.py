@@ -6,6 +6,7 @@ detects anomalies by comparing current values against baseline thresholds.
 
 from __future__ import annotations
 
+import sys
 from typing import Any
 
 import structlog
@@ -16,6 +17,13 @@ from incident_response.tools.infrastructure import query_metrics
 
 logger = structlog.get_logger(__name__)
 
+# Severity indicators emitted by this agent
+EXTREME_ERROR_RATE = "extreme_error_rate"
+CPU_CRITICAL = "cpu_critical"
+MEMORY_CRITICAL = "memory_critical"
+LATENCY_DEGRADATION = "latency_degradation"
+CONNECTION_PRESSURE = "connection_pressure"
+
 
 class MetricsCheckerAgent(LlmAgent):
     """Checks infrastructure metrics for anomalies and threshold violations.
@@ -44,8 +52,9 @@ class MetricsCheckerAgent(LlmAgent):
         Expects:
             context["alert"]: Alert instance
 
-        Sets:
-            context["metrics_diagnostics"]: DiagnosticResult instance
+        Returns:
+            Only this agent's output, ``{"metrics_diagnostics": DiagnosticResult}``;
+            the context is a read-only view under ParallelAgent.
         """
         alert = context["alert"]
         service = alert.service
@@ -57,7 +66,7 @@ class MetricsCheckerAgent(LlmAgent):
 
         findings: list[str] = []
         anomalies: list[dict[str, Any]] = []
-        severity_indicators: list[str] = []
+        severity_indicators: set[str] = set()
 
         current = metrics_data.get("current", {})
         baseline = metrics_data.get("baseline", {})
@@ -80,27 +89,28 @@ class MetricsCheckerAgent(LlmAgent):
 
             # Map metric anomalies to severity indicators
             if metric_name == "error_rate" and deviation > 500:
-                severity_indicators.append("extreme_error_rate")
+                severity_indicators.add(EXTREME_ERROR_RATE)
             elif metric_name == "cpu_pct" and current_val > 90:
-                severity_indicators.append("cpu_critical")
+                severity_indicators.add(CPU_CRITICAL)
             elif metric_name == "memory_pct" and current_val > 90:
-                severity_indicators.append("memory_critical")
+                severity_indicators.add(MEMORY_CRITICAL)
             elif "latency" in metric_name and deviation > 200:
-                severity_indicators.append("latency_degradation")
+                severity_indicators.add(LATENCY_DEGRADATION)
             elif metric_name == "active_connections" and deviation > 80:
-                severity_indicators.append("connection_pressure")
+                severity_indicators.add(CONNECTION_PRESSURE)
 
             if sev == "critical":
-                severity_indicators.append(f"{metric_name}_critical")
+                # Dynamic tag; intern so repeats share one string
+                severity_indicators.add(sys.intern(f"{metric_name}_critical"))
 
         # Check for metrics within normal range (good to report as well)
-        normal_metrics = []
-        for metric_name, val in current.items():
-            baseline_val = baseline.get(metric_name, val)
-            if baseline_val > 0:
-                ratio = val / baseline_val
-                if 0.8 <= ratio <= 1.5:
-                    normal_metrics.append(metric_name)
+        # Single pass; compare without dividing: 0.8 <= val/base <= 1.5
+        normal_metrics = [
+            metric_name
+            for metric_name, val in current.items()
+            if (base := baseline.get(metric_name, val)) > 0
+            and 0.8 * base <= val <= 1.5 * base
+        ]
 
         if normal_metrics:
             findings.append(
@@ -116,16 +126,15 @@ class MetricsCheckerAgent(LlmAgent):
                 f"Detected {len(detected_anomalies)} metric anomalies for {service}.",
             )
 
-        diagnostic = DiagnosticResult(
+        # Fields are built locally with the right types; skip re-validation
+        diagnostic = DiagnosticResult.model_construct(
             agent_name=self.name,
             findings=findings,
             anomalies=anomalies,
-            severity_indicators=list(set(severity_indicators)),
+            severity_indicators=sorted(severity_indicators),
             raw_data=metrics_data,
         )
 
-        context["metrics_diagnostics"] = diagnostic
-
         logger.info(
             "metrics_check_complete",
             service=service,
@@ -133,4 +142,4 @@ class MetricsCheckerAgent(LlmAgent):
             findings=len(findings),
         )
 
-        return context
+        return {"metrics_diagnostics": diagnostic}
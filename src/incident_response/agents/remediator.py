@@ -3,29 +3,45 @@
 Executes runbook-driven remediation steps based on diagnostic findings.
 Simulates actions like service restarts, scale-ups, deploy rollbacks,
 cache clears, and certificate rotations with realistic delays and outcomes.
+Simulated delays are scaled by ``context["_delay_scale"]`` (set from
+``Settings.remediation_delay_scale``); a scale of 0 only yields to the loop.
 """
 
 from __future__ import annotations
 
 import asyncio
+import itertools
 import random
-from typing import Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
 import structlog
 
 from incident_response.agents.base import LlmAgent
-from incident_response.models import (
-    DiagnosticResult,
-    EscalationLevel,
-    RemediationAction,
-    SeverityLevel,
-)
+from incident_response.models import DiagnosticResult, RemediationAction
 from incident_response.tools.runbooks import RUNBOOKS, select_runbook_for_symptom
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Mapping
+
 logger = structlog.get_logger(__name__)
 
+# Scale applied to runbook delays when the context does not set one
+DEFAULT_DELAY_SCALE = 0.5
+
+# Dedicated generator for simulated outcomes, independent of global random state
+_rng = random.Random()
+
+# Simulated reasons a remediation attempt did not fully succeed
+_FAILURE_REASONS = (
+    "Step 3 failed: health check returned non-200 status",
+    "Timeout waiting for pods to reach Ready state",
+    "Error rate did not decrease within expected timeframe",
+    "Partial success: some pods healthy but not all replicas",
+)
+
 # Mapping from diagnostic severity indicators to remediation symptoms
-INDICATOR_TO_SYMPTOM: dict[str, str] = {
+INDICATOR_TO_SYMPTOM: Mapping[str, str] = MappingProxyType({
     "cpu_critical": "high_cpu",
     "memory_critical": "memory_leak",
     "extreme_error_rate": "regression_after_deploy",
@@ -39,7 +55,39 @@ INDICATOR_TO_SYMPTOM: dict[str, str] = {
     "image_version_mismatch": "regression_after_deploy",
     "env_var_drift": "config_drift",
     "critical_config_drift": "config_drift",
+})
+
+# Context keys holding DiagnosticResult outputs from the parallel stage
+_DIAG_KEYS = ("log_diagnostics", "metrics_diagnostics", "config_diagnostics")
+
+# Escalating candidate actions per remediation attempt
+ACTION_PRIORITY_BY_ITERATION: dict[int, tuple[str, ...]] = {
+    1: ("restart_service", "clear_cache", "drain_connections"),
+    2: ("scale_up", "drain_connections", "restart_service"),
+    3: ("rollback_deploy", "scale_up", "rotate_certs"),
 }
+_DEFAULT_CANDIDATES: tuple[str, ...] = ("restart_service",)
+
+
+def _build_action_table(candidates: tuple[str, ...]) -> dict[str, str]:
+    """Map each known symptom to its runbook action when it is a candidate."""
+    symptoms = set(INDICATOR_TO_SYMPTOM.values())
+    for runbook in RUNBOOKS.values():
+        symptoms.update(runbook.get("applicable_symptoms", ()))
+    table: dict[str, str] = {}
+    for symptom in symptoms:
+        action = select_runbook_for_symptom(symptom)
+        if action and action in candidates:
+            table[symptom] = action
+    return table
+
+
+# iteration -> symptom -> runbook action, resolved once at import
+_ACTION_TABLE: dict[int, dict[str, str]] = {
+    iteration: _build_action_table(candidates)
+    for iteration, candidates in ACTION_PRIORITY_BY_ITERATION.items()
+}
+_DEFAULT_ACTION_TABLE = _build_action_table(_DEFAULT_CANDIDATES)
 
 
 class RemediationAgent(LlmAgent):
@@ -73,6 +121,7 @@ class RemediationAgent(LlmAgent):
             context["metrics_diagnostics"]: DiagnosticResult (optional)
             context["config_diagnostics"]: DiagnosticResult (optional)
             context["loop_iteration"]: int (which remediation attempt)
+            context["_delay_scale"]: float (optional, simulated delay scale)
 
         Sets:
             context["remediation_actions"]: list of RemediationAction
@@ -88,18 +137,21 @@ class RemediationAgent(LlmAgent):
             iteration=iteration,
         )
 
-        # Collect all severity indicators from diagnostics
-        all_indicators: list[str] = []
-        for diag_key in ["log_diagnostics", "metrics_diagnostics", "config_diagnostics"]:
-            diag: DiagnosticResult | None = context.get(diag_key)
-            if diag and isinstance(diag, DiagnosticResult):
-                all_indicators.extend(diag.severity_indicators)
+        # Stream severity indicators from all diagnostics without a merged list
+        all_indicators = itertools.chain.from_iterable(
+            diag.severity_indicators for diag in _diagnostics(context)
+        )
 
         # Select remediation action based on iteration and indicators
         action = _select_action(service, all_indicators, iteration, context)
 
         # Execute the remediation
-        executed_action = await _execute_remediation(action, service, iteration)
+        executed_action = await _execute_remediation(
+            action,
+            service,
+            iteration,
+            delay_scale=context.get("_delay_scale", DEFAULT_DELAY_SCALE),
+        )
 
         # Store results
         existing_actions: list[RemediationAction] = context.get("remediation_actions", [])
@@ -118,9 +170,23 @@ class RemediationAgent(LlmAgent):
         return context
 
 
+def _diagnostics(context: dict[str, Any]) -> Iterator[DiagnosticResult]:
+    """Yield the diagnostic results present in ``context``.
+
+    The diagnostics agents only ever store a DiagnosticResult under these
+    keys (or leave them unset), so a ``None`` check is enough; the type is
+    still asserted in non-optimized runs.
+    """
+    for key in _DIAG_KEYS:
+        diag = context.get(key)
+        if diag is not None:
+            assert isinstance(diag, DiagnosticResult), key
+            yield diag
+
+
 def _select_action(
     service: str,
-    indicators: list[str],
+    indicators: Iterable[str],
     iteration: int,
     context: dict[str, Any],
 ) -> str:
@@ -131,26 +197,18 @@ def _select_action(
     - Iteration 2: scale_up or drain_connections (medium)
     - Iteration 3: rollback_deploy (higher risk)
     """
-    # Map indicators to symptoms
-    symptoms: set[str] = set()
-    for indicator in indicators:
-        symptom = INDICATOR_TO_SYMPTOM.get(indicator)
-        if symptom:
-            symptoms.add(symptom)
-
-    # Escalation-based action selection
-    action_priority_by_iteration: dict[int, list[str]] = {
-        1: ["restart_service", "clear_cache", "drain_connections"],
-        2: ["scale_up", "drain_connections", "restart_service"],
-        3: ["rollback_deploy", "scale_up", "rotate_certs"],
+    # Map indicators to symptoms (duplicates collapse in the set)
+    symptoms = {
+        INDICATOR_TO_SYMPTOM[indicator]
+        for indicator in indicators
+        if indicator in INDICATOR_TO_SYMPTOM
     }
 
-    candidates = action_priority_by_iteration.get(iteration, ["restart_service"])
-
-    # Try to match a symptom to a runbook first
+    # Try to match a symptom to a runbook allowed at this escalation step
+    table = _ACTION_TABLE.get(iteration, _DEFAULT_ACTION_TABLE)
     for symptom in symptoms:
-        matched_action = select_runbook_for_symptom(symptom)
-        if matched_action and matched_action in candidates:
+        matched_action = table.get(symptom)
+        if matched_action:
             return matched_action
 
     # Check for specific patterns
@@ -161,18 +219,20 @@ def _select_action(
         return "rollback_deploy"
 
     # Fall back to the first candidate for this iteration
-    return candidates[0]
+    return ACTION_PRIORITY_BY_ITERATION.get(iteration, _DEFAULT_CANDIDATES)[0]
 
 
 async def _execute_remediation(
     action_type: str,
     service: str,
     iteration: int,
+    delay_scale: float = DEFAULT_DELAY_SCALE,
 ) -> RemediationAction:
     """Simulate executing a remediation action with realistic timing.
 
     Success probability increases slightly with iteration to simulate
-    that escalated actions are more likely to resolve the issue.
+    that escalated actions are more likely to resolve the issue. The
+    runbook's nominal delay is multiplied by ``delay_scale``.
     """
     runbook = RUNBOOKS.get(action_type, {})
     runbook_name = runbook.get("name", action_type)
@@ -197,12 +257,12 @@ async def _execute_remediation(
     }
     delay = base_delay.get(action_type, 2.0)
     # Scale down for demo purposes (real would be much longer)
-    await asyncio.sleep(delay * 0.5)
+    await asyncio.sleep(delay * delay_scale)
 
     # Determine success (probability increases with iteration)
     # Iteration 1: 40%, 2: 60%, 3: 85%
     success_prob = min(0.4 + (iteration - 1) * 0.2, 0.85)
-    success = random.random() < success_prob
+    success = _rng.random() < success_prob
 
     # Build output message
     if success:
@@ -213,15 +273,9 @@ async def _execute_remediation(
             f"Service is responding to health checks."
         )
     else:
-        failure_reasons = [
-            f"Step 3 failed: health check returned non-200 status",
-            f"Timeout waiting for pods to reach Ready state",
-            f"Error rate did not decrease within expected timeframe",
-            f"Partial success: some pods healthy but not all replicas",
-        ]
         output = (
             f"Remediation {runbook_name} on {service} did not fully succeed. "
-            f"Reason: {random.choice(failure_reasons)}"
+            f"Reason: {_FAILURE_REASONS[_rng.randrange(len(_FAILURE_REASONS))]}"
         )
 
     # Build parameters used
@@ -235,7 +289,8 @@ async def _execute_remediation(
     elif action_type == "rollback_deploy":
         parameters["target_version"] = "previous"
 
-    return RemediationAction(
+    # Fields are built locally with the right types; skip re-validation
+    return RemediationAction.model_construct(
         action_type=action_type,
         description=f"Execute {runbook_name} for {service} (attempt {iteration})",
         runbook_id=runbook_id,
@@ -6,7 +6,9 @@ builds the escalation path for the incident response lifecycle.
 
 from __future__ import annotations
 
-from typing import Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 import structlog
 
@@ -14,9 +16,31 @@ from incident_response.agents.base import LlmAgent
 from incident_response.mock_data.infrastructure import ONCALL_ROTATION
 from incident_response.models import EscalationLevel, IncidentContext, SeverityLevel
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
 logger = structlog.get_logger(__name__)
 
 
+class OncallEntry(NamedTuple):
+    """One team's on-call rotation, parsed once from ``ONCALL_ROTATION``."""
+
+    l1_oncall: str
+    l2_oncall: str
+    l3_senior: str
+    l4_manager: str
+    slack_channel: str
+    pagerduty_service: str
+
+
+# Every rotation entry must carry all OncallEntry fields; a KeyError here
+# flags malformed mock data at import instead of a silent "unknown" later.
+_ONCALL: dict[str, OncallEntry] = {
+    team: OncallEntry(**{field: entry[field] for field in OncallEntry._fields})
+    for team, entry in ONCALL_ROTATION.items()
+}
+
+
 class ResponderAssignerAgent(LlmAgent):
     """Assigns the initial responder and escalation path.
 
@@ -41,17 +65,17 @@ class ResponderAssignerAgent(LlmAgent):
         Expects:
             context["incident_context"]: IncidentContext
             context["severity"]: SeverityLevel
-            context["owner_team"]: str
+            context["_shared"]["owner_team"]: str
 
         Sets:
             context["assigned_responder"]: dict with responder info
-            context["escalation_path"]: list of escalation steps
+            context["escalation_path"]: tuple of read-only escalation steps
             context["escalation_level"]: EscalationLevel
             context["notification_channels"]: list of notification targets
         """
         incident_ctx: IncidentContext = context["incident_context"]
         severity: SeverityLevel = context["severity"]
-        owner_team: str = context.get("owner_team", "platform")
+        owner_team: str = context.get("_shared", {}).get("owner_team", "platform")
 
         logger.info(
             "assigning_responder",
@@ -60,40 +84,14 @@ class ResponderAssignerAgent(LlmAgent):
             owner_team=owner_team,
         )
 
-        # Look up on-call rotation
-        oncall = ONCALL_ROTATION.get(owner_team, ONCALL_ROTATION.get("platform", {}))
-
-        # Determine initial escalation level based on severity
-        if severity == SeverityLevel.P1:
-            # P1: Start at L2 (skip automation for critical)
-            initial_level = EscalationLevel.L2_ONCALL
-            assigned_to = oncall.get("l2_oncall", "unknown")
-        elif severity == SeverityLevel.P2:
-            # P2: Start with automation, but alert on-call
-            initial_level = EscalationLevel.L1_AUTO
-            assigned_to = oncall.get("l1_oncall", "unknown")
-        else:
-            # P3/P4: Full automation
-            initial_level = EscalationLevel.L1_AUTO
-            assigned_to = "automation"
-
-        # Build escalation path
-        escalation_path = _build_escalation_path(severity, oncall)
-
-        # Determine notification channels
-        notification_channels = [oncall.get("slack_channel", "#incidents")]
-        if severity in (SeverityLevel.P1, SeverityLevel.P2):
-            notification_channels.append(f"pagerduty:{oncall.get('pagerduty_service', 'default')}")
-        if severity == SeverityLevel.P1:
-            notification_channels.append("#incident-war-room")
-
-        assigned_responder = {
-            "name": assigned_to,
-            "team": owner_team,
-            "level": initial_level.value,
-            "pagerduty_service": oncall.get("pagerduty_service", ""),
-            "slack_channel": oncall.get("slack_channel", ""),
-        }
+        # Responder, channels and starting level are fixed per (severity, team)
+        responder, channels, initial_level = _responder_template(severity, owner_team)
+        assigned_responder = dict(responder)
+        assigned_to = assigned_responder["name"]
+        notification_channels = list(channels)
+
+        # Build escalation path (shared, read-only per severity and team)
+        escalation_path = _build_escalation_path(severity, owner_team)
 
         context["assigned_responder"] = assigned_responder
         context["escalation_path"] = escalation_path
@@ -111,24 +109,66 @@ class ResponderAssignerAgent(LlmAgent):
         return context
 
 
-def _build_escalation_path(
+@lru_cache(maxsize=64)
+def _responder_template(
     severity: SeverityLevel,
-    oncall: dict[str, Any],
-) -> list[dict[str, Any]]:
-    """Build the escalation chain based on severity.
+    owner_team: str,
+) -> tuple[Mapping[str, Any], tuple[str, ...], EscalationLevel]:
+    """Resolve the first responder, notification channels and starting level.
 
-    Returns a list of escalation steps in order. P1 incidents start
-    higher in the chain and have shorter timeouts.
+    Memoized per (severity, owner_team); callers copy the returned
+    responder mapping and channel tuple before storing them.
     """
-    base_timeout = {
-        SeverityLevel.P1: 5,    # 5 min before escalation
-        SeverityLevel.P2: 15,   # 15 min
-        SeverityLevel.P3: 30,   # 30 min
-        SeverityLevel.P4: 60,   # 60 min
-    }
-    timeout_minutes = base_timeout.get(severity, 30)
-
-    path: list[dict[str, Any]] = [
+    oncall = _oncall_for(owner_team)
+
+    # Determine initial escalation level based on severity
+    if severity == SeverityLevel.P1:
+        # P1: Start at L2 (skip automation for critical)
+        initial_level = EscalationLevel.L2_ONCALL
+        assigned_to = oncall.l2_oncall
+    elif severity == SeverityLevel.P2:
+        # P2: Start with automation, but alert on-call
+        initial_level = EscalationLevel.L1_AUTO
+        assigned_to = oncall.l1_oncall
+    else:
+        # P3/P4: Full automation
+        initial_level = EscalationLevel.L1_AUTO
+        assigned_to = "automation"
+
+    # Determine notification channels
+    channels = [oncall.slack_channel]
+    if severity in (SeverityLevel.P1, SeverityLevel.P2):
+        channels.append(f"pagerduty:{oncall.pagerduty_service}")
+    if severity == SeverityLevel.P1:
+        channels.append("#incident-war-room")
+
+    responder = MappingProxyType({
+        "name": assigned_to,
+        "team": owner_team,
+        "level": initial_level.value,
+        "pagerduty_service": oncall.pagerduty_service,
+        "slack_channel": oncall.slack_channel,
+    })
+    return responder, tuple(channels), initial_level
+
+
+# Minutes before escalating from L1; later levels wait 2x, 3x and 4x this
+_BASE_TIMEOUT_MINUTES: dict[SeverityLevel, int] = {
+    SeverityLevel.P1: 5,
+    SeverityLevel.P2: 15,
+    SeverityLevel.P3: 30,
+    SeverityLevel.P4: 60,
+}
+
+
+def _escalation_steps(
+    severity: SeverityLevel,
+    oncall: OncallEntry,
+) -> tuple[Mapping[str, Any], ...]:
+    """Assemble the read-only escalation chain for one severity and rotation."""
+    timeout_minutes = _BASE_TIMEOUT_MINUTES.get(severity, 30)
+
+    path = (
         {
             "level": EscalationLevel.L1_AUTO.value,
             "action": "Automated remediation attempt",
@@ -139,20 +179,50 @@ def _build_escalation_path(
             "level": EscalationLevel.L2_ONCALL.value,
             "action": "Page primary on-call engineer",
             "timeout_minutes": timeout_minutes * 2,
-            "assignee": oncall.get("l2_oncall", "unknown"),
+            "assignee": oncall.l2_oncall,
         },
         {
             "level": EscalationLevel.L3_SENIOR.value,
             "action": "Escalate to senior/staff engineer",
             "timeout_minutes": timeout_minutes * 3,
-            "assignee": oncall.get("l3_senior", "unknown"),
+            "assignee": oncall.l3_senior,
         },
         {
             "level": EscalationLevel.L4_MANAGEMENT.value,
             "action": "Escalate to engineering management",
             "timeout_minutes": timeout_minutes * 4,
-            "assignee": oncall.get("l4_manager", "unknown"),
+            "assignee": oncall.l4_manager,
         },
-    ]
+    )
 
+    return tuple(MappingProxyType(step) for step in path)
+
+
+# Every (severity, team) escalation chain, built once at import
+_ESCALATION_PATHS: dict[tuple[SeverityLevel, str], tuple[Mapping[str, Any], ...]] = {
+    (severity, team): _escalation_steps(severity, oncall)
+    for severity in SeverityLevel
+    for team, oncall in _ONCALL.items()
+}
+
+
+def _build_escalation_path(
+    severity: SeverityLevel,
+    owner_team: str,
+) -> tuple[Mapping[str, Any], ...]:
+    """Return the escalation chain based on severity.
+
+    Returns the escalation steps in order. P1 incidents start higher in
+    the chain and have shorter timeouts. Chains are precomputed for every
+    severity and team, so the steps are shared and read-only; unknown
+    teams get the platform chain.
+    """
+    path = _ESCALATION_PATHS.get((severity, owner_team))
+    if path is None:
+        path = _ESCALATION_PATHS[(severity, "platform")]
     return path
+
+
+def _oncall_for(team: str) -> OncallEntry:
+    """Return the team's rotation, falling back to the platform team."""
+    return _ONCALL.get(team) or _ONCALL["platform"]
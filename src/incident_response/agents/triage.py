@@ -6,6 +6,8 @@ keyword-based heuristics as a fallback for the LLM-powered ADK triage.
 
 from __future__ import annotations
 
+import re
+from functools import lru_cache
 from typing import Any
 
 import structlog
@@ -19,25 +21,44 @@ logger = structlog.get_logger(__name__)
 # Keyword-based severity classification rules
 # ---------------------------------------------------------------------------
 
-P1_KEYWORDS = {
+P1_KEYWORDS = frozenset({
     "outage", "down", "critical", "crash", "crashloopbackoff",
     "oom", "out of memory", "data loss", "security breach",
     "complete failure", "service unavailable", "503", "502",
     "connection refused", "fatal", "catastrophic",
-}
+})
 
-P2_KEYWORDS = {
+P2_KEYWORDS = frozenset({
     "degraded", "high error", "high-error", "spike", "surge",
     "elevated", "exhaustion", "exhausted", "timeout", "leak",
     "circuit breaker", "5xx", "connection pool", "expir",
-}
+})
 
-P3_KEYWORDS = {
+P3_KEYWORDS = frozenset({
     "slow", "latency", "delayed", "warning", "warn",
     "increased", "above threshold", "drift", "unassigned",
     "yellow", "lag", "backlog",
+})
+
+
+def _keyword_pattern(keywords: frozenset[str]) -> re.Pattern[str]:
+    """Compile a keyword set into one alternation, longest keyword first."""
+    return re.compile("|".join(re.escape(kw) for kw in sorted(keywords, key=len, reverse=True)))
+
+
+# One-step severity upgrade applied to P3/P4 incidents on critical-tier services
+_UPGRADE_FOR_CRITICAL_TIER: dict[SeverityLevel, SeverityLevel] = {
+    SeverityLevel.P4: SeverityLevel.P3,
+    SeverityLevel.P3: SeverityLevel.P2,
 }
 
+# Severity tiers in precedence order; each is a single C-level scan of the text
+_SEVERITY_PATTERNS: tuple[tuple[SeverityLevel, re.Pattern[str]], ...] = (
+    (SeverityLevel.P1, _keyword_pattern(P1_KEYWORDS)),
+    (SeverityLevel.P2, _keyword_pattern(P2_KEYWORDS)),
+    (SeverityLevel.P3, _keyword_pattern(P3_KEYWORDS)),
+)
+
 
 class TriageAgent(LlmAgent):
     """Classifies incident severity and provides reasoning.
@@ -75,23 +96,19 @@ class TriageAgent(LlmAgent):
 
         logger.info("triaging_incident", alert_id=alert.id, service=alert.service)
 
-        # Build searchable text from alert content
-        search_text = (
-            f"{alert.title} {alert.description} "
-            f"{' '.join(str(v) for v in alert.raw_data.values())}"
-        ).lower()
-
-        # Determine base severity from keywords
-        severity, keyword_match = _classify_by_keywords(search_text)
+        # Determine base severity from keywords in the alert content
+        severity, keyword_match = _classify_by_keywords(alert.search_text)
 
         # Adjust severity based on service tier
         service_tier = service_info.get("tier", "medium")
         tier_adjustment = ""
-        if service_tier == "critical" and severity in (SeverityLevel.P3, SeverityLevel.P4):
-            severity = SeverityLevel(f"P{max(1, int(severity.value[1]) - 1)}")
+        if service_tier == "critical" and severity in _UPGRADE_FOR_CRITICAL_TIER:
+            upgraded = _UPGRADE_FOR_CRITICAL_TIER[severity]
             tier_adjustment = (
-                f" Upgraded from {severity.value} due to critical service tier."
+                f" Upgraded from {severity.value} to {upgraded.value} "
+                "due to critical service tier."
             )
+            severity = upgraded
 
         # Check for recent deployments correlation
         deploy_correlation = ""
@@ -105,17 +122,22 @@ class TriageAgent(LlmAgent):
                 f"Changelog: {latest.get('changelog', 'N/A')}."
             )
 
-        # Build reasoning
+        # Build reasoning from the non-empty parts only
         reasoning_parts = [
             f"Alert '{alert.title}' on service '{alert.service}' "
-            f"classified as {severity.value}.",
-            f"Keyword match: '{keyword_match}'." if keyword_match else "",
-            f"Service tier: {service_tier}.",
-            tier_adjustment,
-            deploy_correlation,
-            f"Related incidents found: {len(incident_ctx.related_incidents)}.",
+            f"classified as {severity.value}."
         ]
-        reasoning = " ".join(part for part in reasoning_parts if part)
+        if keyword_match:
+            reasoning_parts.append(f"Keyword match: '{keyword_match}'.")
+        reasoning_parts.append(f"Service tier: {service_tier}.")
+        if tier_adjustment:
+            reasoning_parts.append(tier_adjustment)
+        if deploy_correlation:
+            reasoning_parts.append(deploy_correlation)
+        reasoning_parts.append(
+            f"Related incidents found: {len(incident_ctx.related_incidents)}."
+        )
+        reasoning = " ".join(reasoning_parts)
 
         context["severity"] = severity
         context["triage_reasoning"] = reasoning
@@ -131,23 +153,20 @@ class TriageAgent(LlmAgent):
         return context
 
 
+@lru_cache(maxsize=4096)
 def _classify_by_keywords(text: str) -> tuple[SeverityLevel, str]:
     """Match text against severity keyword sets.
 
+    Memoized: replayed alert streams repeat descriptions verbatim, so
+    recurring text is classified with a single hash lookup.
+
     Returns:
         Tuple of (SeverityLevel, matched_keyword). Falls back to P4
         if no keywords match.
     """
-    for keyword in P1_KEYWORDS:
-        if keyword in text:
-            return SeverityLevel.P1, keyword
-
-    for keyword in P2_KEYWORDS:
-        if keyword in text:
-            return SeverityLevel.P2, keyword
-
-    for keyword in P3_KEYWORDS:
-        if keyword in text:
-            return SeverityLevel.P3, keyword
+    for severity, pattern in _SEVERITY_PATTERNS:
+        match = pattern.search(text)
+        if match is not None:
+            return severity, match.group()
 
     return SeverityLevel.P4, ""
@@ -17,13 +17,13 @@ from incident_response.tools.health_checks import check_service_health
 
 logger = structlog.get_logger(__name__)
 
-# Escalation level progression
-_ESCALATION_ORDER = [
-    EscalationLevel.L1_AUTO,
-    EscalationLevel.L2_ONCALL,
-    EscalationLevel.L3_SENIOR,
-    EscalationLevel.L4_MANAGEMENT,
-]
+# Escalation level progression (L4 is terminal)
+_NEXT_ESCALATION: dict[EscalationLevel, EscalationLevel] = {
+    EscalationLevel.L1_AUTO: EscalationLevel.L2_ONCALL,
+    EscalationLevel.L2_ONCALL: EscalationLevel.L3_SENIOR,
+    EscalationLevel.L3_SENIOR: EscalationLevel.L4_MANAGEMENT,
+    EscalationLevel.L4_MANAGEMENT: EscalationLevel.L4_MANAGEMENT,
+}
 
 
 class VerificationAgent(LlmAgent):
@@ -123,9 +123,4 @@ def _next_escalation_level(current: EscalationLevel) -> EscalationLevel:
     Returns the next level in the chain, or L4_MANAGEMENT if already
     at the highest level.
     """
-    try:
-        current_idx = _ESCALATION_ORDER.index(current)
-        next_idx = min(current_idx + 1, len(_ESCALATION_ORDER) - 1)
-        return _ESCALATION_ORDER[next_idx]
-    except ValueError:
-        return EscalationLevel.L2_ONCALL
+    return _NEXT_ESCALATION.get(current, EscalationLevel.L2_ONCALL)
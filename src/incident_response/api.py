@@ -11,20 +11,27 @@ Exposes REST endpoints for:
 from __future__ import annotations
 
 import asyncio
-import json
+import heapq
+import secrets
 import uuid
-from datetime import datetime, timezone
-from typing import Any
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from itertools import islice
+from operator import attrgetter
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
 import structlog
 from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel, Field
 from sse_starlette.sse import EventSourceResponse
 
 from common import ErrorResponse, HealthResponse
-
+from incident_response._json import dumpb, dumps, dumps_model
 from incident_response.config import Settings
 from incident_response.mock_data.alerts import MOCK_ALERTS, get_alert_by_id
 from incident_response.models import (
@@ -35,6 +42,7 @@ from incident_response.models import (
     SeverityLevel,
 )
 from incident_response.streaming import (
+    EVENT_BATCH,
     EVENT_ERROR,
     EVENT_ESCALATING,
     EVENT_HUMAN_TAKEOVER,
@@ -44,8 +52,38 @@ from incident_response.streaming import (
 from incident_response.tools.runbooks import list_runbooks as get_all_runbooks
 from incident_response.workflow.pipeline import run_incident_pipeline
 
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Mapping
+
 logger = structlog.get_logger(__name__)
 
+# Current UTC timestamp, with ``datetime.now`` and the tz pre-bound
+_now = partial(datetime.now, timezone.utc)
+
+# Static discovery payloads, serialized once instead of on every request
+_MOCK_ALERTS_JSON = dumps(
+    {
+        "alerts": [a.model_dump(mode="json") for a in MOCK_ALERTS],
+        "total": len(MOCK_ALERTS),
+    }
+)
+_RUNBOOKS = get_all_runbooks()
+_RUNBOOKS_JSON = dumps({"runbooks": _RUNBOOKS, "total": len(_RUNBOOKS)})
+
+# Keyword arguments update_session() may apply; anything else is ignored
+_SESSION_FIELDS = frozenset(IncidentSession.model_fields)
+
+_ESCALATION_LEVELS: Mapping[str, EscalationLevel] = MappingProxyType(
+    {level.value: level for level in EscalationLevel}
+)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered by pydantic-core instead of the stdlib encoder."""
+
+    def render(self, content: Any) -> bytes:
+        return dumpb(content)
+
 
 # ---------------------------------------------------------------------------
 # Request / Response models
@@ -96,23 +134,40 @@ class TakeoverRequest(BaseModel):
 
 
 class SessionManager:
-    """In-memory incident session store."""
+    """In-memory incident session store.
+
+    Sessions are kept in creation order, so listing newest-first needs no
+    sort and the oldest (first to expire) sessions are always at the front.
+    Per-state and per-severity indexes of session IDs keep filtered
+    listings proportional to the number of matches. The store is only
+    touched from the event loop and no method awaits mid-update, so no
+    locking is needed.
+    """
 
-    def __init__(self) -> None:
+    def __init__(self, ttl_seconds: float | None = None) -> None:
         self._sessions: dict[str, IncidentSession] = {}
         self._pipeline_tasks: dict[str, asyncio.Task[Any]] = {}
+        # session_id -> JSON encoding, dropped whenever the session changes
+        self._json: dict[str, str] = {}
+        self._by_state: defaultdict[IncidentState, set[str]] = defaultdict(set)
+        self._by_severity: defaultdict[SeverityLevel, set[str]] = defaultdict(set)
+        self._ttl = timedelta(seconds=ttl_seconds) if ttl_seconds else None
 
     async def create_session(self, alert: Alert) -> IncidentSession:
         """Create a new incident session from an alert."""
-        session_id = str(uuid.uuid4())
-        session = IncidentSession(
+        session_id = uuid.uuid4().hex
+        now = _now()
+        # The alert is already a validated model; skip re-validation
+        session = IncidentSession.model_construct(
             id=session_id,
             state=IncidentState.RECEIVED,
             alert=alert,
-            created_at=datetime.now(tz=timezone.utc),
-            updated_at=datetime.now(tz=timezone.utc),
+            created_at=now,
+            updated_at=now,
         )
         self._sessions[session_id] = session
+        self._by_state[session.state].add(session_id)
+        self._by_severity[session.severity].add(session_id)
         return session
 
     def get_session(self, session_id: str) -> IncidentSession | None:
@@ -124,24 +179,103 @@ class SessionManager:
         session = self._sessions.get(session_id)
         if session is None:
             return None
+        old_state, old_severity = session.state, session.severity
         for key, value in kwargs.items():
-            if hasattr(session, key):
+            if key in _SESSION_FIELDS:
                 setattr(session, key, value)
-        session.updated_at = datetime.now(tz=timezone.utc)
+        if session.state != old_state:
+            self._by_state[old_state].discard(session_id)
+            self._by_state[session.state].add(session_id)
+        if session.severity != old_severity:
+            self._by_severity[old_severity].discard(session_id)
+            self._by_severity[session.severity].add(session_id)
+        session.updated_at = _now()
+        self._json.pop(session_id, None)
         return session
 
+    def session_json(self, session: IncidentSession) -> str:
+        """Return the session's JSON encoding, reusing it until it changes."""
+        encoded = self._json.get(session.id)
+        if encoded is None:
+            encoded = self._json[session.id] = dumps_model(session)
+        return encoded
+
     def list_sessions(
         self,
         state: IncidentState | None = None,
         severity: SeverityLevel | None = None,
+        limit: int | None = None,
     ) -> list[IncidentSession]:
-        """Return all sessions with optional filters."""
-        sessions = list(self._sessions.values())
+        """Return sessions newest-first with optional filters.
+
+        Unfiltered listings walk the store in reverse creation order and
+        stop after ``limit`` sessions; filtered listings only touch the
+        matching index entries.
+        """
+        buckets: list[set[str]] = []
+        if state is not None:
+            buckets.append(self._by_state.get(state, set()))
+        if severity is not None:
+            buckets.append(self._by_severity.get(severity, set()))
+        if not buckets:
+            return list(islice(reversed(self._sessions.values()), limit))
+
+        sessions = [self._sessions[session_id] for session_id in set.intersection(*buckets)]
+        by_created = attrgetter("created_at")
+        if limit is not None:
+            return heapq.nlargest(limit, sessions, key=by_created)
+        return sorted(sessions, key=by_created, reverse=True)
+
+    def count_sessions(
+        self,
+        state: IncidentState | None = None,
+        severity: SeverityLevel | None = None,
+    ) -> int:
+        """Return how many sessions match the filters, ignoring any limit."""
+        buckets: list[set[str]] = []
         if state is not None:
-            sessions = [s for s in sessions if s.state == state]
+            buckets.append(self._by_state.get(state, set()))
         if severity is not None:
-            sessions = [s for s in sessions if s.severity == severity]
-        return sorted(sessions, key=lambda s: s.created_at, reverse=True)
+            buckets.append(self._by_severity.get(severity, set()))
+        if not buckets:
+            return len(self._sessions)
+        return len(set.intersection(*buckets))
+
+    def evict_expired(self, now: datetime | None = None) -> list[str]:
+        """Drop sessions created more than the TTL ago.
+
+        Any pipeline still running for an evicted session is cancelled.
+
+        Returns:
+            IDs of the evicted sessions.
+        """
+        if self._ttl is None:
+            return []
+        cutoff = (now or _now()) - self._ttl
+        expired: list[str] = []
+        for session_id, session in self._sessions.items():
+            if session.created_at > cutoff:
+                break
+            expired.append(session_id)
+
+        for session_id in expired:
+            session = self._sessions.pop(session_id)
+            self._by_state[session.state].discard(session_id)
+            self._by_severity[session.severity].discard(session_id)
+            self._json.pop(session_id, None)
+            self.cancel_pipeline(session_id)
+        return expired
+
+    def track_pipeline(self, session_id: str, task: asyncio.Task[Any]) -> None:
+        """Remember the pipeline task for a session until it finishes."""
+        self._pipeline_tasks[session_id] = task
+        task.add_done_callback(lambda _: self._pipeline_tasks.pop(session_id, None))
+
+    def cancel_pipeline(self, session_id: str) -> None:
+        """Cancel the session's pipeline task if it is still running."""
+        task = self._pipeline_tasks.pop(session_id, None)
+        if task is not None and not task.done():
+            task.cancel()
 
 
 # ---------------------------------------------------------------------------
@@ -154,8 +288,61 @@ class AppState:
 
     def __init__(self, settings: Settings) -> None:
         self.settings = settings
-        self.session_manager = SessionManager()
-        self.event_stream = IncidentEventStream()
+        self.session_manager = SessionManager(ttl_seconds=settings.session_ttl_seconds)
+        self.event_stream = IncidentEventStream(max_history=settings.sse_max_history)
+
+
+async def _run_pipeline(state: AppState, session_id: str, alert: Alert) -> None:
+    """Run the incident pipeline for a session and record its outcome."""
+    try:
+        result = await run_incident_pipeline(
+            alert=alert,
+            settings=state.settings,
+            event_stream=state.event_stream,
+            session_id=session_id,
+        )
+        # Update session with final state
+        is_resolved = result.get("loop_complete", False)
+        final_state = IncidentState.RESOLVED if is_resolved else IncidentState.HUMAN_TAKEOVER
+        state.session_manager.update_session(
+            session_id,
+            state=final_state,
+            severity=result.get("severity", SeverityLevel.P4),
+            context=result.get("incident_context"),
+            diagnostics=[
+                result.get(k)
+                for k in ["log_diagnostics", "metrics_diagnostics", "config_diagnostics"]
+                if result.get(k) is not None
+            ],
+            remediations=result.get("remediation_actions", []),
+            escalation_level=result.get("escalation_level", EscalationLevel.L1_AUTO),
+            report=result.get("report"),
+        )
+    except Exception as exc:
+        logger.error("pipeline_task_error", session_id=session_id, error=str(exc))
+        state.session_manager.update_session(
+            session_id,
+            state=IncidentState.FAILED,
+            error=str(exc),
+        )
+        await state.event_stream.emit(
+            session_id,
+            EVENT_ERROR,
+            data={"error": str(exc)},
+            message=f"Pipeline failed: {exc}",
+        )
+
+
+async def _sweep_expired_sessions(state: AppState) -> None:
+    """Periodically evict expired sessions and their event history."""
+    interval = max(1.0, state.settings.session_ttl_seconds / 10)
+    while True:
+        await asyncio.sleep(interval)
+        evicted = state.session_manager.evict_expired()
+        for session_id in evicted:
+            state.event_stream.clear(session_id)
+        if evicted:
+            logger.info("sessions_evicted", count=len(evicted))
 
 
 # ---------------------------------------------------------------------------
@@ -166,6 +353,18 @@ class AppState:
 def create_app(settings: Settings | None = None) -> FastAPI:
     """Create and configure the FastAPI application."""
     settings = settings or Settings()
+    state = AppState(settings)
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        # Build the OpenAPI schema up front; FastAPI otherwise generates it
+        # on the first /docs or /openapi.json request.
+        app.openapi()
+        sweeper = asyncio.create_task(_sweep_expired_sessions(state))
+        try:
+            yield
+        finally:
+            sweeper.cancel()
 
     app = FastAPI(
         title="Incident Response Orchestrator",
@@ -177,6 +376,8 @@ def create_app(settings: Settings | None = None) -> FastAPI:
         version=settings.service_version,
         docs_url="/docs",
         redoc_url="/redoc",
+        lifespan=lifespan,
+        default_response_class=FastJSONResponse,
     )
 
     # CORS
@@ -189,7 +390,6 @@ def create_app(settings: Settings | None = None) -> FastAPI:
     )
 
     # Shared state
-    state = AppState(settings)
     app.state.app_state = state
     app.state.settings = settings
 
@@ -236,7 +436,7 @@ def create_app(settings: Settings | None = None) -> FastAPI:
                     detail="Either alert_id or both title and service are required.",
                 )
             alert = Alert(
-                id=f"ALT-{uuid.uuid4().hex[:6].upper()}",
+                id=f"ALT-{secrets.token_hex(3).upper()}",
                 source=req.source,
                 title=req.title,
                 description=req.description,
@@ -249,49 +449,8 @@ def create_app(settings: Settings | None = None) -> FastAPI:
         session = await state.session_manager.create_session(alert)
 
         # Launch pipeline asynchronously
-        async def _run_pipeline() -> None:
-            try:
-                result = await run_incident_pipeline(
-                    alert=alert,
-                    settings=settings,
-                    event_stream=state.event_stream,
-                    session_id=session.id,
-                )
-                # Update session with final state
-                is_resolved = result.get("loop_complete", False)
-                final_state = (
-                    IncidentState.RESOLVED if is_resolved else IncidentState.HUMAN_TAKEOVER
-                )
-                state.session_manager.update_session(
-                    session.id,
-                    state=final_state,
-                    severity=result.get("severity", SeverityLevel.P4),
-                    context=result.get("incident_context"),
-                    diagnostics=[
-                        result.get(k)
-                        for k in ["log_diagnostics", "metrics_diagnostics", "config_diagnostics"]
-                        if result.get(k) is not None
-                    ],
-                    remediations=result.get("remediation_actions", []),
-                    escalation_level=result.get("escalation_level", EscalationLevel.L1_AUTO),
-                    report=result.get("report"),
-                )
-            except Exception as exc:
-                logger.error("pipeline_task_error", session_id=session.id, error=str(exc))
-                state.session_manager.update_session(
-                    session.id,
-                    state=IncidentState.FAILED,
-                    error=str(exc),
-                )
-                await state.event_stream.emit(
-                    session.id,
-                    EVENT_ERROR,
-                    data={"error": str(exc)},
-                    message=f"Pipeline failed: {exc}",
-                )
-
-        task = asyncio.create_task(_run_pipeline())
-        state.session_manager._pipeline_tasks[session.id] = task
+        task = asyncio.create_task(_run_pipeline(state, session.id, alert))
+        state.session_manager.track_pipeline(session.id, task)
 
         return {
             "session_id": session.id,
@@ -302,12 +461,15 @@ def create_app(settings: Settings | None = None) -> FastAPI:
         }
 
     @app.get("/api/v1/incidents/{session_id}", tags=["incidents"])
-    async def get_incident(session_id: str) -> dict[str, Any]:
+    async def get_incident(session_id: str) -> Response:
         """Get the current state of an incident session."""
         session = state.session_manager.get_session(session_id)
         if session is None:
             raise HTTPException(status_code=404, detail=f"Session {session_id} not found")
-        return session.model_dump(mode="json")
+        return Response(
+            content=state.session_manager.session_json(session),
+            media_type="application/json",
+        )
 
     @app.get("/api/v1/incidents/{session_id}/stream", tags=["incidents"])
     async def stream_incident(session_id: str) -> EventSourceResponse:
@@ -317,13 +479,35 @@ def create_app(settings: Settings | None = None) -> FastAPI:
             raise HTTPException(status_code=404, detail=f"Session {session_id} not found")
 
         async def event_generator():  # type: ignore[no-untyped-def]
-            async for event in state.event_stream.subscribe(session_id):
-                yield {
-                    "event": event.event_type,
-                    "data": json.dumps(event.model_dump(), default=str),
-                }
-
-        return EventSourceResponse(event_generator())
+            if settings.sse_coalesce_ms <= 0:
+                async for event in state.event_stream.subscribe(session_id):
+                    yield {
+                        "event": event.event_type,
+                        "data": event.sse_data,
+                    }
+                return
+
+            batches = state.event_stream.subscribe_batched(
+                session_id, window=settings.sse_coalesce_ms / 1000
+            )
+            async for batch in batches:
+                if len(batch) == 1:
+                    yield {"event": batch[0].event_type, "data": batch[0].sse_data}
+                else:
+                    # Splice the cached per-event encodings into one JSON array
+                    yield {
+                        "event": EVENT_BATCH,
+                        "data": "[" + ",".join(e.sse_data for e in batch) + "]",
+                    }
+
+        # The periodic ping comment keeps idle connections open and flushes
+        # intermediaries; the explicit identity encoding stops compression
+        # middleware and proxies from buffering frames into batches.
+        return EventSourceResponse(
+            event_generator(),
+            # Keep reverse proxies (nginx) from buffering the stream
+            headers={"X-Accel-Buffering": "no"},
+        )
 
     @app.post("/api/v1/incidents/{session_id}/escalate", tags=["incidents"])
     async def escalate_incident(
@@ -341,16 +525,15 @@ def create_app(settings: Settings | None = None) -> FastAPI:
             )
 
         # Determine target level
-        target_level = EscalationLevel.L3_SENIOR
-        if req.level:
-            try:
-                target_level = EscalationLevel(req.level)
-            except ValueError:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Invalid escalation level: {req.level}. "
-                    f"Valid: {[e.value for e in EscalationLevel]}",
-                )
+        target_level = (
+            _ESCALATION_LEVELS.get(req.level) if req.level else EscalationLevel.L3_SENIOR
+        )
+        if target_level is None:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid escalation level: {req.level}. "
+                f"Valid: {list(_ESCALATION_LEVELS)}",
+            )
 
         state.session_manager.update_session(
             session_id,
@@ -384,13 +567,11 @@ def create_app(settings: Settings | None = None) -> FastAPI:
         if session is None:
             raise HTTPException(status_code=404, detail=f"Session {session_id} not found")
 
-        if session.state == IncidentState.RESOLVED:
+        if session.state is IncidentState.RESOLVED:
             raise HTTPException(status_code=400, detail="Incident is already resolved")
 
         # Cancel any running pipeline task
-        task = state.session_manager._pipeline_tasks.get(session_id)
-        if task and not task.done():
-            task.cancel()
+        state.session_manager.cancel_pipeline(session_id)
 
         state.session_manager.update_session(
             session_id,
@@ -419,13 +600,11 @@ def create_app(settings: Settings | None = None) -> FastAPI:
         if session is None:
             raise HTTPException(status_code=404, detail=f"Session {session_id} not found")
 
-        if session.state == IncidentState.RESOLVED:
+        if session.state is IncidentState.RESOLVED:
             raise HTTPException(status_code=400, detail="Incident is already resolved")
 
         # Cancel any running pipeline task
-        task = state.session_manager._pipeline_tasks.get(session_id)
-        if task and not task.done():
-            task.cancel()
+        state.session_manager.cancel_pipeline(session_id)
 
         state.session_manager.update_session(
             session_id,
@@ -453,33 +632,33 @@ def create_app(settings: Settings | None = None) -> FastAPI:
     async def list_incidents(
         state_filter: IncidentState | None = Query(default=None, alias="state"),
         severity_filter: SeverityLevel | None = Query(default=None, alias="severity"),
-    ) -> dict[str, Any]:
-        """List all incidents with optional filters."""
-        sessions = state.session_manager.list_sessions(
+        limit: int | None = Query(default=None, ge=1),
+    ) -> Response:
+        """List incidents newest-first with optional filters."""
+        manager = state.session_manager
+        sessions = manager.list_sessions(
             state=state_filter,
             severity=severity_filter,
+            limit=limit,
         )
-        return {
-            "incidents": [s.model_dump(mode="json") for s in sessions],
-            "total": len(sessions),
+        body = dumpb({
+            "incidents": sessions,
+            "total": manager.count_sessions(state=state_filter, severity=severity_filter),
             "filters": {
                 "state": state_filter.value if state_filter else None,
                 "severity": severity_filter.value if severity_filter else None,
             },
-        }
+        })
+        return Response(content=body, media_type="application/json")
 
     # -------------------------------------------------------------------
     # Runbooks endpoint
     # -------------------------------------------------------------------
 
     @app.get("/api/v1/runbooks", tags=["runbooks"])
-    async def list_runbooks_endpoint() -> dict[str, Any]:
+    async def list_runbooks_endpoint() -> Response:
         """List all available remediation runbooks."""
-        runbooks = get_all_runbooks()
-        return {
-            "runbooks": runbooks,
-            "total": len(runbooks),
-        }
+        return Response(content=_RUNBOOKS_JSON, media_type="application/json")
 
     # -------------------------------------------------------------------
     # Diagnostics endpoint
@@ -504,12 +683,9 @@ def create_app(settings: Settings | None = None) -> FastAPI:
     # -------------------------------------------------------------------
 
     @app.get("/api/v1/alerts/mock", tags=["alerts"])
-    async def list_mock_alerts() -> dict[str, Any]:
+    async def list_mock_alerts() -> Response:
         """List all available mock alerts for testing."""
-        return {
-            "alerts": [a.model_dump(mode="json") for a in MOCK_ALERTS],
-            "total": len(MOCK_ALERTS),
-        }
+        return Response(content=_MOCK_ALERTS_JSON, media_type="application/json")
 
     # -------------------------------------------------------------------
     # Error handlers
@@ -30,10 +30,20 @@ class Settings(BaseSettings):
 
     # Remediation
     remediation_timeout: int = 120
+    # Fraction of each runbook's nominal duration the simulation sleeps for;
+    # 0 skips the waits entirely (tests, scenario replay, benchmarks)
+    remediation_delay_scale: float = 0.5
 
     # Session management
     session_ttl_seconds: int = 3600
 
+    # SSE: most recent events kept per session, for late joiners to replay
+    # and as the furthest a slow subscriber can lag before events are skipped
+    sse_max_history: int = 512
+    # SSE: window (ms) for coalescing bursts of events into one "batch" frame;
+    # 0 sends every event as its own frame
+    sse_coalesce_ms: int = 0
+
 
 def get_settings() -> Settings:
     """Return a cached settings instance."""
@@ -39,7 +39,12 @@ def build_app(settings: Settings | None = None) -> object:
 
 
 def main() -> None:
-    """Launch the Incident Response Orchestrator server."""
+    """Launch the Incident Response Orchestrator server.
+
+    Runs a single uvicorn worker on purpose: incident sessions, pipeline
+    tasks and SSE event streams live in this process's memory, so extra
+    workers would each see only the incidents they created themselves.
+    """
     settings = get_settings()
     setup_logging(settings.log_level)
 
@@ -6,16 +6,26 @@ sources such as Datadog, CloudWatch, Prometheus, and PagerDuty.
 
 from __future__ import annotations
 
+from collections import defaultdict
 from datetime import datetime, timedelta, timezone
+from types import MappingProxyType
+from typing import TYPE_CHECKING
 
 from incident_response.models import Alert
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
 
 def _now() -> datetime:
     """Return current UTC timestamp."""
     return datetime.now(tz=timezone.utc)
 
 
+# Single reference time for every mock alert timestamp
+_IMPORT_NOW = _now()
+
+
 MOCK_ALERTS: list[Alert] = [
     Alert(
         id="ALT-001",
@@ -28,7 +38,7 @@ MOCK_ALERTS: list[Alert] = [
         ),
         service="payment-service",
         host="payment-service-pod-7f8d9",
-        timestamp=_now() - timedelta(minutes=2),
+        timestamp=_IMPORT_NOW - timedelta(minutes=2),
         raw_data={
             "monitor_id": "mon-12345",
             "metric": "system.cpu.user",
@@ -49,7 +59,7 @@ MOCK_ALERTS: list[Alert] = [
         ),
         service="order-processor",
         host="order-processor-pod-3a4b5",
-        timestamp=_now() - timedelta(minutes=5),
+        timestamp=_IMPORT_NOW - timedelta(minutes=5),
         raw_data={
             "alarm_name": "order-processor-oom",
             "metric": "container.memory.usage",
@@ -71,7 +81,7 @@ MOCK_ALERTS: list[Alert] = [
         ),
         service="api-gateway",
         host="api-gateway-pod-9c8d7",
-        timestamp=_now() - timedelta(minutes=1),
+        timestamp=_IMPORT_NOW - timedelta(minutes=1),
         raw_data={
             "alertname": "HighErrorRate",
             "metric": "http_requests_total{status=~'5..'}",
@@ -92,13 +102,13 @@ MOCK_ALERTS: list[Alert] = [
         ),
         service="auth-service",
         host="auth-service-pod-1e2f3",
-        timestamp=_now() - timedelta(hours=1),
+        timestamp=_IMPORT_NOW - timedelta(hours=1),
         raw_data={
             "cert_cn": "auth.example.com",
-            "expiry_date": (_now() + timedelta(hours=48)).isoformat(),
+            "expiry_date": (_IMPORT_NOW + timedelta(hours=48)).isoformat(),
             "issuer": "Let's Encrypt Authority X3",
             "auto_renew_status": "failed",
-            "last_renewal_attempt": (_now() - timedelta(hours=6)).isoformat(),
+            "last_renewal_attempt": (_IMPORT_NOW - timedelta(hours=6)).isoformat(),
             "error": "DNS challenge timeout after 120s",
         },
     ),
@@ -113,7 +123,7 @@ MOCK_ALERTS: list[Alert] = [
         ),
         service="log-aggregator",
         host="log-aggregator-pod-6g7h8",
-        timestamp=_now() - timedelta(minutes=15),
+        timestamp=_IMPORT_NOW - timedelta(minutes=15),
         raw_data={
             "monitor_id": "mon-67890",
             "metric": "system.disk.in_use",
@@ -136,7 +146,7 @@ MOCK_ALERTS: list[Alert] = [
         ),
         service="recommendation-engine",
         host="recommendation-engine-pod-4i5j6",
-        timestamp=_now() - timedelta(minutes=30),
+        timestamp=_IMPORT_NOW - timedelta(minutes=30),
         raw_data={
             "alertname": "MemoryLeakSuspected",
             "metric": "jvm_heap_memory_used_bytes",
@@ -158,7 +168,7 @@ MOCK_ALERTS: list[Alert] = [
         ),
         service="db-proxy",
         host="db-proxy-pod-2k3l4",
-        timestamp=_now() - timedelta(minutes=3),
+        timestamp=_IMPORT_NOW - timedelta(minutes=3),
         raw_data={
             "alarm_name": "db-proxy-pool-exhaustion",
             "metric": "connection_pool.active",
@@ -181,7 +191,7 @@ MOCK_ALERTS: list[Alert] = [
         ),
         service="search-service",
         host="search-service-pod-5m6n7",
-        timestamp=_now() - timedelta(minutes=8),
+        timestamp=_IMPORT_NOW - timedelta(minutes=8),
         raw_data={
             "alertname": "HighLatency",
             "metric": "http_request_duration_seconds",
@@ -205,7 +215,7 @@ MOCK_ALERTS: list[Alert] = [
         ),
         service="notification-service",
         host="notification-service-pod-8o9p0",
-        timestamp=_now() - timedelta(minutes=12),
+        timestamp=_IMPORT_NOW - timedelta(minutes=12),
         raw_data={
             "monitor_id": "mon-11111",
             "metric": "kafka.consumer.lag",
@@ -229,7 +239,7 @@ MOCK_ALERTS: list[Alert] = [
         ),
         service="cdn-edge",
         host="cdn-edge-node-us-west-2a",
-        timestamp=_now() - timedelta(minutes=6),
+        timestamp=_IMPORT_NOW - timedelta(minutes=6),
         raw_data={
             "failure_rate_pct": 8.0,
             "affected_region": "us-west-2",
@@ -245,14 +255,26 @@ MOCK_ALERTS: list[Alert] = [
 ]
 
 
+# Read-only ID index over MOCK_ALERTS, built once at import
+_ALERTS_BY_ID: Mapping[str, Alert] = MappingProxyType({a.id: a for a in MOCK_ALERTS})
+
+
+def _index_by_service(alerts: list[Alert]) -> Mapping[str, tuple[Alert, ...]]:
+    """Group alerts by service, preserving their order in ``alerts``."""
+    grouped: defaultdict[str, list[Alert]] = defaultdict(list)
+    for alert in alerts:
+        grouped[alert.service].append(alert)
+    return MappingProxyType({service: tuple(group) for service, group in grouped.items()})
+
+
+_ALERTS_BY_SERVICE = _index_by_service(MOCK_ALERTS)
+
+
 def get_alert_by_id(alert_id: str) -> Alert | None:
     """Look up a mock alert by its ID."""
-    for alert in MOCK_ALERTS:
-        if alert.id == alert_id:
-            return alert
-    return None
+    return _ALERTS_BY_ID.get(alert_id)
 
 
-def get_alerts_by_service(service: str) -> list[Alert]:
+def get_alerts_by_service(service: str) -> tuple[Alert, ...]:
     """Return all mock alerts for a given service."""
-    return [a for a in MOCK_ALERTS if a.service == service]
+    return _ALERTS_BY_SERVICE.get(service, ())
@@ -6,8 +6,13 @@ and baseline metric data for a Kubernetes-based microservices platform.
 
 from __future__ import annotations
 
+from collections import defaultdict
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
 
 
 def _now() -> datetime:
@@ -15,11 +20,24 @@ def _now() -> datetime:
     return datetime.now(tz=timezone.utc)
 
 
+# Single reference time for every mock deploy timestamp
+_IMPORT_NOW = _now()
+
+
+def _ago(delta: timedelta) -> str:
+    """ISO timestamp ``delta`` before import time."""
+    return (_IMPORT_NOW - delta).isoformat()
+
+
+# Shared read-only results for lookup misses
+_EMPTY_MAP: Mapping[str, Any] = MappingProxyType({})
+
+
 # ---------------------------------------------------------------------------
 # Service Registry
 # ---------------------------------------------------------------------------
 
-SERVICE_REGISTRY: dict[str, dict[str, Any]] = {
+SERVICE_REGISTRY: Mapping[str, dict[str, Any]] = MappingProxyType({
     "payment-service": {
         "name": "payment-service",
         "namespace": "payments",
@@ -33,7 +51,7 @@ SERVICE_REGISTRY: dict[str, dict[str, Any]] = {
         "sla_availability": 99.99,
         "language": "java",
         "framework": "spring-boot",
-        "dependencies": ["db-proxy", "auth-service", "notification-service"],
+        "dependencies": ("db-proxy", "auth-service", "notification-service"),
         "health_endpoint": "/actuator/health",
         "image": "registry.example.com/payment-service:v2.14.3",
     },
@@ -50,7 +68,7 @@ SERVICE_REGISTRY: dict[str, dict[str, Any]] = {
         "sla_availability": 99.95,
         "language": "python",
         "framework": "fastapi",
-        "dependencies": ["db-proxy", "payment-service", "notification-service"],
+        "dependencies": ("db-proxy", "payment-service", "notification-service"),
         "health_endpoint": "/health",
         "image": "registry.example.com/order-processor:v1.8.2",
     },
@@ -67,7 +85,7 @@ SERVICE_REGISTRY: dict[str, dict[str, Any]] = {
         "sla_availability": 99.99,
         "language": "go",
         "framework": "gin",
-        "dependencies": ["auth-service"],
+        "dependencies": ("auth-service",),
         "health_endpoint": "/healthz",
         "image": "registry.example.com/api-gateway:v3.2.1",
     },
@@ -84,7 +102,7 @@ SERVICE_REGISTRY: dict[str, dict[str, Any]] = {
         "sla_availability": 99.99,
         "language": "go",
         "framework": "gin",
-        "dependencies": ["db-proxy"],
+        "dependencies": ("db-proxy",),
         "health_endpoint": "/healthz",
         "image": "registry.example.com/auth-service:v2.6.0",
     },
@@ -101,7 +119,7 @@ SERVICE_REGISTRY: dict[str, dict[str, Any]] = {
         "sla_availability": 99.9,
         "language": "java",
         "framework": "custom",
-        "dependencies": [],
+        "dependencies": (),
         "health_endpoint": "/health",
         "image": "registry.example.com/log-aggregator:v1.4.0",
     },
@@ -118,7 +136,7 @@ SERVICE_REGISTRY: dict[str, dict[str, Any]] = {
         "sla_availability": 99.9,
         "language": "python",
         "framework": "fastapi",
-        "dependencies": ["db-proxy", "search-service"],
+        "dependencies": ("db-proxy", "search-service"),
         "health_endpoint": "/health",
         "image": "registry.example.com/recommendation-engine:v2.1.0",
     },
@@ -135,7 +153,7 @@ SERVICE_REGISTRY: dict[str, dict[str, Any]] = {
         "sla_availability": 99.999,
         "language": "go",
         "framework": "pgbouncer",
-        "dependencies": [],
+        "dependencies": (),
         "health_endpoint": "/healthz",
         "image": "registry.example.com/db-proxy:v1.2.0",
     },
@@ -152,7 +170,7 @@ SERVICE_REGISTRY: dict[str, dict[str, Any]] = {
         "sla_availability": 99.95,
         "language": "python",
         "framework": "fastapi",
-        "dependencies": ["db-proxy"],
+        "dependencies": ("db-proxy",),
         "health_endpoint": "/health",
         "image": "registry.example.com/search-service:v3.0.1",
     },
@@ -169,7 +187,7 @@ SERVICE_REGISTRY: dict[str, dict[str, Any]] = {
         "sla_availability": 99.9,
         "language": "typescript",
         "framework": "nestjs",
-        "dependencies": ["db-proxy"],
+        "dependencies": ("db-proxy",),
         "health_endpoint": "/health",
         "image": "registry.example.com/notification-service:v1.9.0",
     },
@@ -186,11 +204,11 @@ SERVICE_REGISTRY: dict[str, dict[str, Any]] = {
         "sla_availability": 99.999,
         "language": "rust",
         "framework": "actix-web",
-        "dependencies": ["auth-service"],
+        "dependencies": ("auth-service",),
         "health_endpoint": "/healthz",
         "image": "registry.example.com/cdn-edge:v4.1.0",
     },
-}
+})
 
 
 # ---------------------------------------------------------------------------
@@ -201,7 +219,7 @@ DEPLOY_HISTORY: dict[str, list[dict[str, Any]]] = {
     "payment-service": [
         {
             "version": "v2.14.3",
-            "deployed_at": (_now() - timedelta(hours=2)).isoformat(),
+            "deployed_at": _ago(timedelta(hours=2)),
             "deployed_by": "ci-bot",
             "commit": "a1b2c3d",
             "changelog": "Fix race condition in refund processing",
@@ -209,7 +227,7 @@ DEPLOY_HISTORY: dict[str, list[dict[str, Any]]] = {
         },
         {
             "version": "v2.14.2",
-            "deployed_at": (_now() - timedelta(days=1)).isoformat(),
+            "deployed_at": _ago(timedelta(days=1)),
             "deployed_by": "engineer-alice",
             "commit": "e4f5g6h",
             "changelog": "Add retry logic for payment gateway timeouts",
@@ -217,7 +235,7 @@ DEPLOY_HISTORY: dict[str, list[dict[str, Any]]] = {
         },
         {
             "version": "v2.14.1",
-            "deployed_at": (_now() - timedelta(days=3)).isoformat(),
+            "deployed_at": _ago(timedelta(days=3)),
             "deployed_by": "ci-bot",
             "commit": "i7j8k9l",
             "changelog": "Update payment SDK to v4.2",
@@ -225,7 +243,7 @@ DEPLOY_HISTORY: dict[str, list[dict[str, Any]]] = {
         },
         {
             "version": "v2.14.0",
-            "deployed_at": (_now() - timedelta(days=7)).isoformat(),
+            "deployed_at": _ago(timedelta(days=7)),
             "deployed_by": "engineer-bob",
             "commit": "m0n1o2p",
             "changelog": "Add Apple Pay support",
@@ -233,7 +251,7 @@ DEPLOY_HISTORY: dict[str, list[dict[str, Any]]] = {
         },
         {
             "version": "v2.13.8",
-            "deployed_at": (_now() - timedelta(days=14)).isoformat(),
+            "deployed_at": _ago(timedelta(days=14)),
             "deployed_by": "ci-bot",
             "commit": "q3r4s5t",
             "changelog": "Performance optimization for high-volume transactions",
@@ -243,7 +261,7 @@ DEPLOY_HISTORY: dict[str, list[dict[str, Any]]] = {
     "order-processor": [
         {
             "version": "v1.8.2",
-            "deployed_at": (_now() - timedelta(hours=6)).isoformat(),
+            "deployed_at": _ago(timedelta(hours=6)),
             "deployed_by": "engineer-charlie",
             "commit": "u6v7w8x",
             "changelog": "Increase batch size for order aggregation",
@@ -251,7 +269,7 @@ DEPLOY_HISTORY: dict[str, list[dict[str, Any]]] = {
         },
         {
             "version": "v1.8.1",
-            "deployed_at": (_now() - timedelta(days=2)).isoformat(),
+            "deployed_at": _ago(timedelta(days=2)),
             "deployed_by": "ci-bot",
             "commit": "y9z0a1b",
             "changelog": "Fix memory leak in order serialization",
@@ -259,7 +277,7 @@ DEPLOY_HISTORY: dict[str, list[dict[str, Any]]] = {
         },
         {
             "version": "v1.8.0",
-            "deployed_at": (_now() - timedelta(days=5)).isoformat(),
+            "deployed_at": _ago(timedelta(days=5)),
             "deployed_by": "engineer-diana",
             "commit": "c2d3e4f",
             "changelog": "Add bulk order processing endpoint",
@@ -267,7 +285,7 @@ DEPLOY_HISTORY: dict[str, list[dict[str, Any]]] = {
         },
         {
             "version": "v1.7.9",
-            "deployed_at": (_now() - timedelta(days=10)).isoformat(),
+            "deployed_at": _ago(timedelta(days=10)),
             "deployed_by": "ci-bot",
             "commit": "g5h6i7j",
             "changelog": "Upgrade FastAPI to 0.110",
@@ -275,7 +293,7 @@ DEPLOY_HISTORY: dict[str, list[dict[str, Any]]] = {
         },
         {
             "version": "v1.7.8",
-            "deployed_at": (_now() - timedelta(days=15)).isoformat(),
+            "deployed_at": _ago(timedelta(days=15)),
             "deployed_by": "ci-bot",
             "commit": "k8l9m0n",
             "changelog": "Add distributed tracing spans",
@@ -285,7 +303,7 @@ DEPLOY_HISTORY: dict[str, list[dict[str, Any]]] = {
     "api-gateway": [
         {
             "version": "v3.2.1",
-            "deployed_at": (_now() - timedelta(days=1)).isoformat(),
+            "deployed_at": _ago(timedelta(days=1)),
             "deployed_by": "ci-bot",
             "commit": "o1p2q3r",
             "changelog": "Update rate limiting configuration",
@@ -293,7 +311,7 @@ DEPLOY_HISTORY: dict[str, list[dict[str, Any]]] = {
         },
         {
             "version": "v3.2.0",
-            "deployed_at": (_now() - timedelta(days=4)).isoformat(),
+            "deployed_at": _ago(timedelta(days=4)),
             "deployed_by": "engineer-eve",
             "commit": "s4t5u6v",
             "changelog": "Add circuit breaker for downstream services",
@@ -303,7 +321,7 @@ DEPLOY_HISTORY: dict[str, list[dict[str, Any]]] = {
     "auth-service": [
         {
             "version": "v2.6.0",
-            "deployed_at": (_now() - timedelta(days=3)).isoformat(),
+            "deployed_at": _ago(timedelta(days=3)),
             "deployed_by": "ci-bot",
             "commit": "w7x8y9z",
             "changelog": "Add OIDC provider integration",
@@ -313,7 +331,7 @@ DEPLOY_HISTORY: dict[str, list[dict[str, Any]]] = {
     "search-service": [
         {
             "version": "v3.0.1",
-            "deployed_at": (_now() - timedelta(hours=4)).isoformat(),
+            "deployed_at": _ago(timedelta(hours=4)),
             "deployed_by": "engineer-frank",
             "commit": "a0b1c2d",
             "changelog": "Fix Elasticsearch query timeout handling",
@@ -321,7 +339,7 @@ DEPLOY_HISTORY: dict[str, list[dict[str, Any]]] = {
         },
         {
             "version": "v3.0.0",
-            "deployed_at": (_now() - timedelta(days=2)).isoformat(),
+            "deployed_at": _ago(timedelta(days=2)),
             "deployed_by": "ci-bot",
             "commit": "e3f4g5h",
             "changelog": "Major: Upgrade to Elasticsearch 8.x",
@@ -335,7 +353,7 @@ DEPLOY_HISTORY: dict[str, list[dict[str, Any]]] = {
 # On-Call Rotation
 # ---------------------------------------------------------------------------
 
-ONCALL_ROTATION: dict[str, dict[str, Any]] = {
+ONCALL_ROTATION: Mapping[str, dict[str, Any]] = MappingProxyType({
     "payments": {
         "team": "payments",
         "l1_oncall": "engineer-alice",
@@ -426,14 +444,14 @@ ONCALL_ROTATION: dict[str, dict[str, Any]] = {
         "escalation_policy": "comms-standard",
         "pagerduty_service": "PSVC009",
     },
-}
+})
 
 
 # ---------------------------------------------------------------------------
 # Baseline Metrics (per service)
 # ---------------------------------------------------------------------------
 
-BASELINE_METRICS: dict[str, dict[str, Any]] = {
+BASELINE_METRICS: Mapping[str, dict[str, Any]] = MappingProxyType({
     "payment-service": {
         "cpu_pct": 45.0,
         "memory_pct": 60.0,
@@ -524,24 +542,62 @@ BASELINE_METRICS: dict[str, dict[str, Any]] = {
         "requests_per_sec": 50000,
         "active_connections": 10000,
     },
-}
+})
+
 
+def _index_services(field: str) -> Mapping[str, tuple[str, ...]]:
+    """Group service names in SERVICE_REGISTRY by the value of ``field``."""
+    grouped: defaultdict[str, list[str]] = defaultdict(list)
+    for name, info in SERVICE_REGISTRY.items():
+        grouped[info[field]].append(name)
+    return MappingProxyType({key: tuple(names) for key, names in grouped.items()})
 
-def get_service_info(service: str) -> dict[str, Any]:
+
+def _index_dependents() -> Mapping[str, tuple[str, ...]]:
+    """Invert the ``dependencies`` edges: service -> services that call it."""
+    grouped: defaultdict[str, list[str]] = defaultdict(list)
+    for name, info in SERVICE_REGISTRY.items():
+        for dependency in info.get("dependencies", ()):
+            grouped[dependency].append(name)
+    return MappingProxyType({dep: tuple(names) for dep, names in grouped.items()})
+
+
+# Secondary indexes over SERVICE_REGISTRY, built once at import
+_SERVICES_BY_TIER = _index_services("tier")
+_SERVICES_BY_TEAM = _index_services("owner_team")
+_DEPENDENTS = _index_dependents()
+
+
+def get_service_info(service: str) -> Mapping[str, Any]:
     """Look up service registry entry."""
-    return SERVICE_REGISTRY.get(service, {})
+    return SERVICE_REGISTRY.get(service, _EMPTY_MAP)
 
 
-def get_deploy_history(service: str) -> list[dict[str, Any]]:
+def get_deploy_history(service: str) -> Sequence[dict[str, Any]]:
     """Return recent deployment history for a service."""
-    return DEPLOY_HISTORY.get(service, [])
+    return DEPLOY_HISTORY.get(service, ())
 
 
-def get_oncall(team: str) -> dict[str, Any]:
+def get_oncall(team: str) -> Mapping[str, Any]:
     """Look up on-call rotation for a team."""
-    return ONCALL_ROTATION.get(team, {})
+    return ONCALL_ROTATION.get(team, _EMPTY_MAP)
 
 
-def get_baseline_metrics(service: str) -> dict[str, Any]:
+def get_baseline_metrics(service: str) -> Mapping[str, Any]:
     """Return baseline metric thresholds for a service."""
-    return BASELINE_METRICS.get(service, {})
+    return BASELINE_METRICS.get(service, _EMPTY_MAP)
+
+
+def get_services_by_tier(tier: str) -> tuple[str, ...]:
+    """Return the names of all services in a tier (e.g. ``"critical"``)."""
+    return _SERVICES_BY_TIER.get(tier, ())
+
+
+def get_services_by_team(team: str) -> tuple[str, ...]:
+    """Return the names of all services owned by a team."""
+    return _SERVICES_BY_TEAM.get(team, ())
+
+
+def get_dependents(service: str) -> tuple[str, ...]:
+    """Return the services that list ``service`` as a direct dependency."""
+    return _DEPENDENTS.get(service, ())
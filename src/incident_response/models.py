@@ -8,10 +8,17 @@ SSE event payloads.
 from __future__ import annotations
 
 import enum
+import sys
 from datetime import datetime, timezone
+from functools import cached_property, partial
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from incident_response._json import dumps_model
+
+# Current UTC timestamp, with ``datetime.now`` and the tz pre-bound
+_now = partial(datetime.now, timezone.utc)
 
 
 # ---------------------------------------------------------------------------
@@ -19,7 +26,7 @@ from pydantic import BaseModel, Field
 # ---------------------------------------------------------------------------
 
 
-class SeverityLevel(str, enum.Enum):
+class SeverityLevel(enum.StrEnum):
     """Incident severity classification following PagerDuty conventions."""
 
     P1 = "P1"  # Critical - service down, customer-facing impact
@@ -28,7 +35,7 @@ class SeverityLevel(str, enum.Enum):
     P4 = "P4"  # Low - minor anomaly, informational
 
 
-class IncidentState(str, enum.Enum):
+class IncidentState(enum.StrEnum):
     """Lifecycle states of an incident response session."""
 
     RECEIVED = "received"
@@ -43,7 +50,7 @@ class IncidentState(str, enum.Enum):
     FAILED = "failed"
 
 
-class EscalationLevel(str, enum.Enum):
+class EscalationLevel(enum.StrEnum):
     """On-call escalation tiers."""
 
     L1_AUTO = "L1_AUTO"      # Automated response
@@ -66,9 +73,22 @@ class Alert(BaseModel):
     description: str
     service: str
     host: str = ""
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(tz=timezone.utc))
+    timestamp: datetime = Field(default_factory=_now)
     raw_data: dict[str, Any] = Field(default_factory=dict)
 
+    @field_validator("service", "source")
+    @classmethod
+    def _intern(cls, value: str) -> str:
+        """Share one string object per name across all alerts and sessions."""
+        return sys.intern(value)
+
+    @cached_property
+    def search_text(self) -> str:
+        """Case-folded title, description and raw values, built once per alert."""
+        return " ".join(
+            [self.title, self.description, *map(str, self.raw_data.values())]
+        ).casefold()
+
 
 class IncidentContext(BaseModel):
     """Enriched context assembled around an alert for triage."""
@@ -81,14 +101,19 @@ class IncidentContext(BaseModel):
 
 
 class DiagnosticResult(BaseModel):
-    """Output from a diagnostic agent (log, metric, or config analysis)."""
+    """Output from a diagnostic agent (log, metric, or config analysis).
+
+    The diagnostic agents build this with :meth:`model_construct` because
+    every field is already typed correctly, and validating ``raw_data``
+    again would walk the whole tool payload.
+    """
 
     agent_name: str
     findings: list[str] = Field(default_factory=list)
     anomalies: list[dict[str, Any]] = Field(default_factory=list)
     severity_indicators: list[str] = Field(default_factory=list)
     raw_data: dict[str, Any] = Field(default_factory=dict)
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(tz=timezone.utc))
+    timestamp: datetime = Field(default_factory=_now)
 
 
 class RemediationAction(BaseModel):
@@ -115,7 +140,7 @@ class IncidentReport(BaseModel):
     escalation_history: list[dict[str, Any]] = Field(default_factory=list)
     resolution_summary: str = ""
     timeline: list[dict[str, Any]] = Field(default_factory=list)
-    created_at: datetime = Field(default_factory=lambda: datetime.now(tz=timezone.utc))
+    created_at: datetime = Field(default_factory=_now)
 
 
 class IncidentSession(BaseModel):
@@ -130,8 +155,8 @@ class IncidentSession(BaseModel):
     remediations: list[RemediationAction] = Field(default_factory=list)
     escalation_level: EscalationLevel = EscalationLevel.L1_AUTO
     report: IncidentReport | None = None
-    created_at: datetime = Field(default_factory=lambda: datetime.now(tz=timezone.utc))
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(tz=timezone.utc))
+    created_at: datetime = Field(default_factory=_now)
+    updated_at: datetime = Field(default_factory=_now)
     error: str | None = None
 
 
@@ -141,10 +166,21 @@ class IncidentSession(BaseModel):
 
 
 class IncidentEvent(BaseModel):
-    """Server-Sent Event pushed during incident response workflow execution."""
+    """Server-Sent Event pushed during incident response workflow execution.
+
+    One instance is shared by every subscriber of the session, so it is
+    frozen; its payload is encoded once, on first use of :attr:`sse_data`.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     event_type: str
     session_id: str
     data: dict[str, Any] = Field(default_factory=dict)
     message: str = ""
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(tz=timezone.utc))
+    timestamp: datetime = Field(default_factory=_now)
+
+    @cached_property
+    def sse_data(self) -> str:
+        """JSON payload for the SSE ``data`` field, encoded once per event."""
+        return dumps_model(self)
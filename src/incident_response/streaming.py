@@ -7,13 +7,18 @@ consume via ``async for`` iteration. Follows the ShoppingEventStream pattern.
 from __future__ import annotations
 
 import asyncio
+from collections import deque
 from datetime import datetime, timezone
-from typing import Any, AsyncIterator
+from itertools import islice
+from typing import TYPE_CHECKING, Any
 
 import structlog
 
 from incident_response.models import IncidentEvent
 
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterable
+
 logger = structlog.get_logger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -38,21 +43,59 @@ EVENT_RESOLVED = "resolved"
 EVENT_HUMAN_TAKEOVER = "human_takeover"
 EVENT_ERROR = "error"
 
+# Frame carrying a JSON array of several events (when coalescing is enabled)
+EVENT_BATCH = "batch"
+
 # Terminal event types that end the SSE stream
 _TERMINAL_EVENTS = {EVENT_RESOLVED, EVENT_HUMAN_TAKEOVER, EVENT_ERROR}
 
+# Upper bound on events grouped into one batch by subscribe_batched()
+DEFAULT_MAX_BATCH = 32
+
+
+class _SessionLog:
+    """Bounded, append-only event log for one session.
+
+    Every subscriber of the session reads from this one log through its
+    own cursor (an absolute sequence number), so publishing is a single
+    append regardless of how many subscribers there are.
+    """
+
+    __slots__ = ("changed", "closed", "events", "next_seq")
+
+    def __init__(self, max_history: int) -> None:
+        self.events: deque[IncidentEvent] = deque(maxlen=max_history)
+        # Sequence number the next appended event will get
+        self.next_seq = 0
+        # Set (then replaced) on every append or close to wake subscribers
+        self.changed = asyncio.Event()
+        self.closed = False
+
+    @property
+    def first_seq(self) -> int:
+        """Sequence number of the oldest event still retained."""
+        return self.next_seq - len(self.events)
+
+    def notify(self) -> None:
+        self.changed.set()
+        self.changed = asyncio.Event()
+
 
 class IncidentEventStream:
     """In-memory pub/sub for incident session SSE events.
 
-    Each incident session gets its own ``asyncio.Queue`` so that multiple
-    SSE subscribers can consume events independently.
+    Each session has a single bounded event log shared by all of its
+    subscribers; a subscriber is just a cursor into that log, so
+    :meth:`emit` is one append and one wake-up however many clients are
+    listening. The log keeps the most recent ``max_history`` events, which
+    late joiners replay. A subscriber that falls further behind than that
+    skips the events trimmed in the meantime, so memory stays bounded and
+    the terminal event is still delivered.
     """
 
-    def __init__(self, max_queue_size: int = 256) -> None:
-        self._queues: dict[str, list[asyncio.Queue[IncidentEvent | None]]] = {}
-        self._max_queue_size = max_queue_size
-        self._history: dict[str, list[IncidentEvent]] = {}
+    def __init__(self, max_history: int = 512) -> None:
+        self._max_history = max_history
+        self._logs: dict[str, _SessionLog] = {}
 
     # ------------------------------------------------------------------
     # Publishing
@@ -69,7 +112,39 @@ class IncidentEventStream:
 
         Returns the constructed :class:`IncidentEvent` for convenience.
         """
-        event = IncidentEvent(
+        log = self._log(session_id)
+        event = self._append(log, session_id, event_type, data, message)
+        log.notify()
+        return event
+
+    async def emit_batch(
+        self,
+        session_id: str,
+        events: Iterable[tuple[str, dict[str, Any] | None, str]],
+    ) -> list[IncidentEvent]:
+        """Push several ``(event_type, data, message)`` events at once.
+
+        The events are appended in order and subscribers are woken once
+        for the whole group rather than once per event.
+        """
+        log = self._log(session_id)
+        emitted = [
+            self._append(log, session_id, event_type, data, message)
+            for event_type, data, message in events
+        ]
+        log.notify()
+        return emitted
+
+    def _append(
+        self,
+        log: _SessionLog,
+        session_id: str,
+        event_type: str,
+        data: dict[str, Any] | None,
+        message: str,
+    ) -> IncidentEvent:
+        # Fields are produced here, not parsed from input: skip validation
+        event = IncidentEvent.model_construct(
             event_type=event_type,
             session_id=session_id,
             data=data or {},
@@ -77,26 +152,20 @@ class IncidentEventStream:
             timestamp=datetime.now(tz=timezone.utc),
         )
 
-        # Persist in history
-        self._history.setdefault(session_id, []).append(event)
-
-        # Fan-out to all live subscriber queues
-        queues = self._queues.get(session_id, [])
-        for queue in queues:
-            try:
-                queue.put_nowait(event)
-            except asyncio.QueueFull:
-                logger.warning(
-                    "event_queue_full",
-                    session_id=session_id,
-                    event_type=event_type,
-                )
+        if len(log.events) == self._max_history - 1:
+            logger.warning(
+                "event_history_full",
+                session_id=session_id,
+                max_history=self._max_history,
+            )
+        log.events.append(event)
+        log.next_seq += 1
 
         logger.debug(
             "event_emitted",
             session_id=session_id,
             event_type=event_type,
-            subscribers=len(queues),
+            seq=log.next_seq - 1,
         )
         return event
 
@@ -107,33 +176,120 @@ class IncidentEventStream:
     async def subscribe(self, session_id: str) -> AsyncIterator[IncidentEvent]:
         """Yield events for *session_id* as they arrive.
 
-        The iterator terminates when the session emits a terminal event
-        (resolved, human_takeover, error), or when ``close(session_id)``
-        is called (which pushes ``None`` as a sentinel).
+        Retained history is replayed first so late joiners catch up. The
+        iterator terminates after a terminal event (resolved,
+        human_takeover, error), or once ``close(session_id)`` is called.
         """
-        queue: asyncio.Queue[IncidentEvent | None] = asyncio.Queue(
-            maxsize=self._max_queue_size
+        log = self._log(session_id)
+        cursor = log.first_seq
+        while True:
+            if cursor == log.next_seq:
+                if log.closed:
+                    return
+                await log.changed.wait()
+                continue
+
+            # Iterate a snapshot: the log may move on while we are suspended
+            cursor, pending = self._read(log, session_id, cursor)
+            for event in pending:
+                cursor += 1
+                yield event
+                if event.event_type in _TERMINAL_EVENTS:
+                    return
+
+    async def subscribe_batched(
+        self,
+        session_id: str,
+        window: float,
+        max_batch: int = DEFAULT_MAX_BATCH,
+    ) -> AsyncIterator[list[IncidentEvent]]:
+        """Yield events for *session_id* grouped into short bursts.
+
+        Retained history is replayed first, in batches of up to
+        *max_batch* events. After that, once a new event arrives, further
+        events are collected for up to *window* seconds or until
+        *max_batch* events are pending.
+        Terminates under the same conditions as :meth:`subscribe`; the
+        terminal event ends its batch.
+        """
+        log = self._log(session_id)
+        history = list(log.events)
+        cursor = log.next_seq
+        # Replay back to back, with no waiting between the batches, up to
+        # and including the first terminal event
+        end = next(
+            (i + 1 for i, e in enumerate(history) if e.event_type in _TERMINAL_EVENTS),
+            None,
         )
-        self._queues.setdefault(session_id, []).append(queue)
+        if end is not None:
+            history = history[:end]
+        for start in range(0, len(history), max_batch):
+            yield history[start:start + max_batch]
+        if end is not None:
+            return
 
-        # Replay any historical events first so late joiners catch up
-        for past_event in self._history.get(session_id, []):
-            yield past_event
+        loop = asyncio.get_running_loop()
+        while True:
+            if cursor == log.next_seq:
+                if log.closed:
+                    return
+                await log.changed.wait()
+                continue
 
-        try:
-            while True:
-                event = await queue.get()
-                if event is None:
-                    # Sentinel: stream closed
+            # Let the burst accumulate unless it is already complete
+            deadline = loop.time() + window
+            while (
+                not log.closed
+                and log.next_seq - cursor < max_batch
+                and not (log.events and log.events[-1].event_type in _TERMINAL_EVENTS)
+            ):
+                remaining = deadline - loop.time()
+                if remaining <= 0:
                     break
-                yield event
-                if event.event_type in _TERMINAL_EVENTS:
+                try:
+                    await asyncio.wait_for(log.changed.wait(), remaining)
+                except TimeoutError:
+                    break
+
+            cursor, pending = self._read(log, session_id, cursor)
+            batch: list[IncidentEvent] = []
+            for event in pending:
+                batch.append(event)
+                if event.event_type in _TERMINAL_EVENTS or len(batch) == max_batch:
                     break
-        finally:
-            # Clean up this subscriber
-            session_queues = self._queues.get(session_id, [])
-            if queue in session_queues:
-                session_queues.remove(queue)
+            if not batch:
+                # Everything pending was trimmed before we read it (e.g. no
+                # history retained); _read already moved the cursor past it
+                continue
+            cursor += len(batch)
+            yield batch
+            if batch[-1].event_type in _TERMINAL_EVENTS:
+                return
+
+    def _log(self, session_id: str) -> _SessionLog:
+        log = self._logs.get(session_id)
+        if log is None:
+            log = self._logs[session_id] = _SessionLog(self._max_history)
+        return log
+
+    def _read(
+        self, log: _SessionLog, session_id: str, cursor: int
+    ) -> tuple[int, list[IncidentEvent]]:
+        """Snapshot the retained events from *cursor* on.
+
+        Returns:
+            The cursor the snapshot starts at (advanced past any events
+            trimmed before this subscriber read them) and the events.
+        """
+        first = log.first_seq
+        if cursor < first:
+            logger.warning(
+                "event_subscriber_lagged",
+                session_id=session_id,
+                skipped=first - cursor,
+            )
+            cursor = first
+        return cursor, list(islice(log.events, cursor - first, None))
 
     # ------------------------------------------------------------------
     # Lifecycle helpers
@@ -141,18 +297,17 @@ class IncidentEventStream:
 
     def close(self, session_id: str) -> None:
         """Signal all subscribers of *session_id* to stop iterating."""
-        for queue in self._queues.get(session_id, []):
-            try:
-                queue.put_nowait(None)
-            except asyncio.QueueFull:
-                pass
-        self._queues.pop(session_id, None)
+        log = self._logs.get(session_id)
+        if log is not None:
+            log.closed = True
+            log.notify()
 
-    def get_history(self, session_id: str) -> list[IncidentEvent]:
-        """Return all events emitted for a given session."""
-        return list(self._history.get(session_id, []))
+    def get_history(self, session_id: str) -> tuple[IncidentEvent, ...]:
+        """Return an immutable snapshot of the retained events for a session."""
+        log = self._logs.get(session_id)
+        return tuple(log.events) if log is not None else ()
 
     def clear(self, session_id: str) -> None:
         """Remove all state associated with a session."""
         self.close(session_id)
-        self._history.pop(session_id, None)
+        self._logs.pop(session_id, None)
@@ -14,6 +14,12 @@ import structlog
 
 logger = structlog.get_logger(__name__)
 
+# Dedicated generator for simulated health, independent of global random state
+_rng = random.Random()
+
+_ALL_CHECKS = ("http_health", "error_rate", "latency_sla", "dependency_check")
+_UNSTABLE_STATUSES = (200, 503, 502)
+
 
 async def check_service_health(
     service: str,
@@ -38,28 +44,28 @@ async def check_service_health(
     # Probability of passing increases with each iteration
     # Iteration 1: 30%, Iteration 2: 65%, Iteration 3: 90%
     pass_probability = min(0.3 + (iteration - 1) * 0.35, 0.95)
-    is_healthy = random.random() < pass_probability
+    is_healthy = _rng.random() < pass_probability
 
     if is_healthy:
         # Healthy state
-        error_rate = round(random.uniform(0.0001, 0.005), 4)
-        p99_latency_ms = random.randint(20, 200)
+        error_rate = round(_rng.uniform(0.0001, 0.005), 4)
+        p99_latency_ms = _rng.randint(20, 200)
         http_status = 200
-        uptime_seconds = random.randint(60, 7200)
-        checks_passed = ["http_health", "error_rate", "latency_sla", "dependency_check"]
+        uptime_seconds = _rng.randint(60, 7200)
+        checks_passed = list(_ALL_CHECKS)
         checks_failed: list[str] = []
     else:
         # Still unhealthy
-        error_rate = round(random.uniform(0.05, 0.25), 4)
-        p99_latency_ms = random.randint(1000, 10000)
-        http_status = random.choice([200, 503, 502])
-        uptime_seconds = random.randint(5, 60)
-        checks_passed = ["dependency_check"] if random.random() > 0.5 else []
-        checks_failed = [
-            check
-            for check in ["http_health", "error_rate", "latency_sla", "dependency_check"]
-            if check not in checks_passed
-        ]
+        error_rate = round(_rng.uniform(0.05, 0.25), 4)
+        p99_latency_ms = _rng.randint(1000, 10000)
+        http_status = _UNSTABLE_STATUSES[_rng.randrange(len(_UNSTABLE_STATUSES))]
+        uptime_seconds = _rng.randint(5, 60)
+        if _rng.random() > 0.5:
+            checks_passed = ["dependency_check"]
+            checks_failed = list(_ALL_CHECKS[:-1])
+        else:
+            checks_passed = []
+            checks_failed = list(_ALL_CHECKS)
 
     result = {
         "service": service,
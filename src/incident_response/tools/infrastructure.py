@@ -7,9 +7,11 @@ based on the service being investigated.
 
 from __future__ import annotations
 
+import itertools
 import random
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
 import structlog
 
@@ -18,14 +20,122 @@ from incident_response.mock_data.infrastructure import (
     SERVICE_REGISTRY,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
 logger = structlog.get_logger(__name__)
 
+# Dedicated generator for simulated jitter, independent of global random state
+_rng = random.Random()
+
+# Trace ids for services without scripted log patterns: unique, and
+# reproducible across runs
+_generic_trace_ids = itertools.count(1000)
+
 
 def _now() -> datetime:
     """Return current UTC timestamp."""
     return datetime.now(tz=timezone.utc)
 
 
+# Service-specific mock log patterns as (minutes_ago, entry) pairs; the
+# timestamp is stamped on per query.
+_LOG_PATTERNS: Mapping[str, tuple[tuple[int, dict[str, Any]], ...]] = MappingProxyType({
+    "payment-service": (
+        (1, {
+            "level": "ERROR",
+            "message": "Connection timeout to payment gateway after 30s",
+            "logger": "com.example.payments.GatewayClient",
+            "trace_id": "abc123def456",
+            "count": 47,
+        }),
+        (3, {
+            "level": "ERROR",
+            "message": "Thread pool exhausted: ActiveCount=200, MaxSize=200",
+            "logger": "com.example.payments.ThreadPoolManager",
+            "trace_id": "ghi789jkl012",
+            "count": 12,
+        }),
+        (5, {
+            "level": "WARN",
+            "message": "GC pause exceeded 500ms: type=Full, duration=1247ms",
+            "logger": "com.example.payments.GCMonitor",
+            "trace_id": "",
+            "count": 8,
+        }),
+    ),
+    "order-processor": (
+        (2, {
+            "level": "FATAL",
+            "message": "OutOfMemoryError: Java heap space",
+            "logger": "order_processor.batch",
+            "trace_id": "mno345pqr678",
+            "count": 12,
+            "stack_trace": (
+                "java.lang.OutOfMemoryError: Java heap space\n"
+                "  at order_processor.batch.OrderAggregator.aggregate(OrderAggregator.java:142)\n"
+                "  at order_processor.batch.BatchRunner.run(BatchRunner.java:87)"
+            ),
+        }),
+        (8, {
+            "level": "ERROR",
+            "message": "Failed to serialize order batch: payload exceeds 64MB limit",
+            "logger": "order_processor.serializer",
+            "trace_id": "stu901vwx234",
+            "count": 5,
+        }),
+    ),
+    "api-gateway": (
+        (1, {
+            "level": "ERROR",
+            "message": "Upstream service unavailable: payment-service returned 503",
+            "logger": "api_gateway.proxy",
+            "trace_id": "yza567bcd890",
+            "count": 234,
+        }),
+        (2, {
+            "level": "ERROR",
+            "message": "Circuit breaker OPEN for payment-service: 50 failures in 60s",
+            "logger": "api_gateway.circuit_breaker",
+            "trace_id": "",
+            "count": 3,
+        }),
+    ),
+    "search-service": (
+        (5, {
+            "level": "ERROR",
+            "message": "Elasticsearch query timeout after 10s on index 'products-v3'",
+            "logger": "search_service.es_client",
+            "trace_id": "efg123hij456",
+            "count": 89,
+        }),
+        (10, {
+            "level": "WARN",
+            "message": "Elasticsearch cluster health YELLOW: 1 unassigned replica shard",
+            "logger": "search_service.health_monitor",
+            "trace_id": "",
+            "count": 1,
+        }),
+    ),
+    "db-proxy": (
+        (1, {
+            "level": "ERROR",
+            "message": "Connection pool exhausted: 200/200 active, 47 waiting",
+            "logger": "db_proxy.pool",
+            "trace_id": "",
+            "count": 156,
+        }),
+        (3, {
+            "level": "WARN",
+            "message": "Slow query detected: SELECT * FROM orders WHERE ... took 12.4s",
+            "logger": "db_proxy.query_analyzer",
+            "trace_id": "klm789nop012",
+            "count": 23,
+        }),
+    ),
+})
+
+
 async def query_logs(
     service: str,
     timerange_minutes: int = 30,
@@ -46,123 +156,22 @@ async def query_logs(
     """
     logger.info("query_logs", service=service, timerange=timerange_minutes)
 
-    # Service-specific mock log patterns
-    log_patterns: dict[str, list[dict[str, Any]]] = {
-        "payment-service": [
-            {
-                "timestamp": (_now() - timedelta(minutes=1)).isoformat(),
-                "level": "ERROR",
-                "message": "Connection timeout to payment gateway after 30s",
-                "logger": "com.example.payments.GatewayClient",
-                "trace_id": "abc123def456",
-                "count": 47,
-            },
-            {
-                "timestamp": (_now() - timedelta(minutes=3)).isoformat(),
-                "level": "ERROR",
-                "message": "Thread pool exhausted: ActiveCount=200, MaxSize=200",
-                "logger": "com.example.payments.ThreadPoolManager",
-                "trace_id": "ghi789jkl012",
-                "count": 12,
-            },
-            {
-                "timestamp": (_now() - timedelta(minutes=5)).isoformat(),
-                "level": "WARN",
-                "message": "GC pause exceeded 500ms: type=Full, duration=1247ms",
-                "logger": "com.example.payments.GCMonitor",
-                "trace_id": "",
-                "count": 8,
-            },
-        ],
-        "order-processor": [
-            {
-                "timestamp": (_now() - timedelta(minutes=2)).isoformat(),
-                "level": "FATAL",
-                "message": "OutOfMemoryError: Java heap space",
-                "logger": "order_processor.batch",
-                "trace_id": "mno345pqr678",
-                "count": 12,
-                "stack_trace": (
-                    "java.lang.OutOfMemoryError: Java heap space\n"
-                    "  at order_processor.batch.OrderAggregator.aggregate(OrderAggregator.java:142)\n"
-                    "  at order_processor.batch.BatchRunner.run(BatchRunner.java:87)"
-                ),
-            },
-            {
-                "timestamp": (_now() - timedelta(minutes=8)).isoformat(),
-                "level": "ERROR",
-                "message": "Failed to serialize order batch: payload exceeds 64MB limit",
-                "logger": "order_processor.serializer",
-                "trace_id": "stu901vwx234",
-                "count": 5,
-            },
-        ],
-        "api-gateway": [
-            {
-                "timestamp": (_now() - timedelta(minutes=1)).isoformat(),
-                "level": "ERROR",
-                "message": "Upstream service unavailable: payment-service returned 503",
-                "logger": "api_gateway.proxy",
-                "trace_id": "yza567bcd890",
-                "count": 234,
-            },
-            {
-                "timestamp": (_now() - timedelta(minutes=2)).isoformat(),
-                "level": "ERROR",
-                "message": "Circuit breaker OPEN for payment-service: 50 failures in 60s",
-                "logger": "api_gateway.circuit_breaker",
-                "trace_id": "",
-                "count": 3,
-            },
-        ],
-        "search-service": [
-            {
-                "timestamp": (_now() - timedelta(minutes=5)).isoformat(),
-                "level": "ERROR",
-                "message": "Elasticsearch query timeout after 10s on index 'products-v3'",
-                "logger": "search_service.es_client",
-                "trace_id": "efg123hij456",
-                "count": 89,
-            },
-            {
-                "timestamp": (_now() - timedelta(minutes=10)).isoformat(),
-                "level": "WARN",
-                "message": "Elasticsearch cluster health YELLOW: 1 unassigned replica shard",
-                "logger": "search_service.health_monitor",
-                "trace_id": "",
-                "count": 1,
-            },
-        ],
-        "db-proxy": [
-            {
-                "timestamp": (_now() - timedelta(minutes=1)).isoformat(),
-                "level": "ERROR",
-                "message": "Connection pool exhausted: 200/200 active, 47 waiting",
-                "logger": "db_proxy.pool",
-                "trace_id": "",
-                "count": 156,
-            },
-            {
-                "timestamp": (_now() - timedelta(minutes=3)).isoformat(),
-                "level": "WARN",
-                "message": "Slow query detected: SELECT * FROM orders WHERE ... took 12.4s",
-                "logger": "db_proxy.query_analyzer",
-                "trace_id": "klm789nop012",
-                "count": 23,
-            },
-        ],
-    }
-
-    entries = log_patterns.get(service, [
-        {
-            "timestamp": (_now() - timedelta(minutes=5)).isoformat(),
+    now = _now()
+    patterns = _LOG_PATTERNS.get(service)
+    if patterns is None:
+        entries = [{
+            "timestamp": (now - timedelta(minutes=5)).isoformat(),
             "level": "ERROR",
             "message": f"Unexpected error in {service}: internal processing failure",
             "logger": f"{service}.main",
-            "trace_id": f"generic-{random.randint(1000, 9999)}",
-            "count": random.randint(1, 20),
-        },
-    ])
+            "trace_id": f"generic-{next(_generic_trace_ids)}",
+            "count": _rng.randint(1, 20),
+        }]
+    else:
+        entries = [
+            {"timestamp": (now - timedelta(minutes=minutes_ago)).isoformat(), **entry}
+            for minutes_ago, entry in patterns
+        ]
 
     return {
         "service": service,
@@ -171,10 +180,34 @@ async def query_logs(
         "total_entries": sum(e.get("count", 1) for e in entries),
         "unique_patterns": len(entries),
         "entries": entries,
-        "query_time_ms": random.randint(50, 500),
+        "query_time_ms": _rng.randint(50, 500),
     }
 
 
+_DEFAULT_BASELINE: Mapping[str, float] = MappingProxyType({
+    "cpu_pct": 40.0,
+    "memory_pct": 50.0,
+    "error_rate": 0.005,
+    "p50_latency_ms": 50,
+    "p99_latency_ms": 200,
+    "requests_per_sec": 1000,
+    "active_connections": 100,
+})
+
+# "Current" values are baseline * multiplier, giving known problem services
+# their anomalies
+_ANOMALY_MULTIPLIERS: Mapping[str, Mapping[str, float]] = MappingProxyType({
+    "payment-service": {"cpu_pct": 2.2, "error_rate": 15.0, "p99_latency_ms": 3.0},
+    "order-processor": {"memory_pct": 1.5, "error_rate": 8.0},
+    "api-gateway": {"error_rate": 124.0, "p99_latency_ms": 5.0},
+    "search-service": {"p99_latency_ms": 20.0, "p50_latency_ms": 8.0},
+    "db-proxy": {"active_connections": 1.3, "p99_latency_ms": 100.0},
+    "log-aggregator": {"cpu_pct": 1.4, "memory_pct": 1.3},
+    "recommendation-engine": {"memory_pct": 1.45, "cpu_pct": 1.2},
+})
+_NO_MULTIPLIERS: Mapping[str, float] = MappingProxyType({})
+
+
 async def query_metrics(
     service: str,
     metric_name: str = "all",
@@ -195,33 +228,16 @@ async def query_metrics(
     """
     logger.info("query_metrics", service=service, metric=metric_name)
 
-    baseline = BASELINE_METRICS.get(service, {
-        "cpu_pct": 40.0,
-        "memory_pct": 50.0,
-        "error_rate": 0.005,
-        "p50_latency_ms": 50,
-        "p99_latency_ms": 200,
-        "requests_per_sec": 1000,
-        "active_connections": 100,
-    })
-
-    # Generate "current" values with some anomalies for known problem services
-    anomaly_multipliers: dict[str, dict[str, float]] = {
-        "payment-service": {"cpu_pct": 2.2, "error_rate": 15.0, "p99_latency_ms": 3.0},
-        "order-processor": {"memory_pct": 1.5, "error_rate": 8.0},
-        "api-gateway": {"error_rate": 124.0, "p99_latency_ms": 5.0},
-        "search-service": {"p99_latency_ms": 20.0, "p50_latency_ms": 8.0},
-        "db-proxy": {"active_connections": 1.3, "p99_latency_ms": 100.0},
-        "log-aggregator": {"cpu_pct": 1.4, "memory_pct": 1.3},
-        "recommendation-engine": {"memory_pct": 1.45, "cpu_pct": 1.2},
-    }
-
-    multipliers = anomaly_multipliers.get(service, {})
+    baseline = BASELINE_METRICS.get(service, _DEFAULT_BASELINE)
+    multipliers = _ANOMALY_MULTIPLIERS.get(service, _NO_MULTIPLIERS)
     current: dict[str, float] = {}
     anomalies: list[dict[str, Any]] = []
 
     for metric, baseline_val in baseline.items():
-        mult = multipliers.get(metric, 1.0 + random.uniform(-0.05, 0.05))
+        mult = multipliers.get(metric)
+        if mult is None:
+            # Only metrics without a scripted anomaly get random noise
+            mult = 1.0 + _rng.uniform(-0.05, 0.05)
         current_val = round(baseline_val * mult, 4)
         current[metric] = current_val
 
@@ -242,10 +258,72 @@ async def query_metrics(
         "baseline": dict(baseline),
         "anomalies": anomalies,
         "anomaly_count": len(anomalies),
-        "query_time_ms": random.randint(20, 200),
+        "query_time_ms": _rng.randint(20, 200),
     }
 
 
+# Simulated config drift scenarios per service
+_DRIFT_SCENARIOS: Mapping[str, tuple[dict[str, Any], ...]] = MappingProxyType({
+    "payment-service": (
+        {
+            "field": "env.JAVA_OPTS",
+            "expected": "-Xmx3g -Xms3g -XX:+UseG1GC",
+            "actual": "-Xmx2g -Xms1g -XX:+UseParallelGC",
+            "severity": "high",
+            "impact": "Suboptimal GC configuration may cause long pause times",
+        },
+        {
+            "field": "resources.limits.cpu",
+            "expected": "2000m",
+            "actual": "1500m",
+            "severity": "medium",
+            "impact": "CPU limit lower than declared, may cause throttling",
+        },
+    ),
+    "order-processor": (
+        {
+            "field": "resources.limits.memory",
+            "expected": "4Gi",
+            "actual": "2Gi",
+            "severity": "critical",
+            "impact": "Memory limit set to half of recommended, causing OOM kills",
+        },
+        {
+            "field": "env.BATCH_SIZE",
+            "expected": "100",
+            "actual": "1000",
+            "severity": "high",
+            "impact": "Batch size 10x higher than recommended, excessive memory usage",
+        },
+    ),
+    "api-gateway": (
+        {
+            "field": "env.CIRCUIT_BREAKER_THRESHOLD",
+            "expected": "10",
+            "actual": "50",
+            "severity": "medium",
+            "impact": "Circuit breaker threshold too high, slow failure detection",
+        },
+    ),
+    "search-service": (
+        {
+            "field": "env.ES_QUERY_TIMEOUT_MS",
+            "expected": "5000",
+            "actual": "30000",
+            "severity": "medium",
+            "impact": "Elasticsearch query timeout too high, holding connections",
+        },
+        {
+            "field": "image",
+            "expected": "registry.example.com/search-service:v3.0.1",
+            "actual": "registry.example.com/search-service:v3.0.0",
+            "severity": "high",
+            "impact": "Running previous version, missing timeout fix",
+        },
+    ),
+})
+
+
 async def check_config(service: str) -> dict[str, Any]:
     """Compare running configuration against expected configuration.
 
@@ -269,68 +347,7 @@ async def check_config(service: str) -> dict[str, Any]:
             "drifts": [],
         }
 
-    # Simulate config drift scenarios per service
-    drift_scenarios: dict[str, list[dict[str, Any]]] = {
-        "payment-service": [
-            {
-                "field": "env.JAVA_OPTS",
-                "expected": "-Xmx3g -Xms3g -XX:+UseG1GC",
-                "actual": "-Xmx2g -Xms1g -XX:+UseParallelGC",
-                "severity": "high",
-                "impact": "Suboptimal GC configuration may cause long pause times",
-            },
-            {
-                "field": "resources.limits.cpu",
-                "expected": "2000m",
-                "actual": "1500m",
-                "severity": "medium",
-                "impact": "CPU limit lower than declared, may cause throttling",
-            },
-        ],
-        "order-processor": [
-            {
-                "field": "resources.limits.memory",
-                "expected": "4Gi",
-                "actual": "2Gi",
-                "severity": "critical",
-                "impact": "Memory limit set to half of recommended, causing OOM kills",
-            },
-            {
-                "field": "env.BATCH_SIZE",
-                "expected": "100",
-                "actual": "1000",
-                "severity": "high",
-                "impact": "Batch size 10x higher than recommended, excessive memory usage",
-            },
-        ],
-        "api-gateway": [
-            {
-                "field": "env.CIRCUIT_BREAKER_THRESHOLD",
-                "expected": "10",
-                "actual": "50",
-                "severity": "medium",
-                "impact": "Circuit breaker threshold too high, slow failure detection",
-            },
-        ],
-        "search-service": [
-            {
-                "field": "env.ES_QUERY_TIMEOUT_MS",
-                "expected": "5000",
-                "actual": "30000",
-                "severity": "medium",
-                "impact": "Elasticsearch query timeout too high, holding connections",
-            },
-            {
-                "field": "image",
-                "expected": "registry.example.com/search-service:v3.0.1",
-                "actual": "registry.example.com/search-service:v3.0.0",
-                "severity": "high",
-                "impact": "Running previous version, missing timeout fix",
-            },
-        ],
-    }
-
-    drifts = drift_scenarios.get(service, [])
+    drifts = list(_DRIFT_SCENARIOS.get(service, ()))
     has_drift = len(drifts) > 0
 
     return {
@@ -343,11 +360,49 @@ async def check_config(service: str) -> dict[str, Any]:
         },
         "drifts": drifts,
         "drift_count": len(drifts),
-        "last_sync": (_now() - timedelta(minutes=random.randint(5, 60))).isoformat(),
+        "last_sync": (_now() - timedelta(minutes=_rng.randint(5, 60))).isoformat(),
         "gitops_repo": "github.com/example/k8s-manifests",
     }
 
 
+# Canned kubectl outputs keyed by (verb,) or (verb, resource). Values are
+# flat and immutable, so kubectl_exec hands out shallow copies.
+_KUBECTL_OUTPUTS: Mapping[tuple[str, ...], dict[str, Any]] = MappingProxyType({
+    ("get", "pods"): {
+        "success": True,
+        "output": (
+            "NAME                              READY   STATUS    RESTARTS   AGE\n"
+            "payment-service-7f8d9-abc12       1/1     Running   0          2h\n"
+            "payment-service-7f8d9-def34       1/1     Running   0          2h\n"
+            "payment-service-7f8d9-ghi56       1/1     Running   3          2h\n"
+            "payment-service-7f8d9-jkl78       0/1     CrashLoopBackOff   5   2h\n"
+        ),
+        "exit_code": 0,
+    },
+    ("top", "pods"): {
+        "success": True,
+        "output": (
+            "NAME                              CPU(cores)   MEMORY(bytes)\n"
+            "payment-service-7f8d9-abc12       1847m        3421Mi\n"
+            "payment-service-7f8d9-def34       1923m        3512Mi\n"
+            "payment-service-7f8d9-ghi56       1756m        3287Mi\n"
+            "payment-service-7f8d9-jkl78       45m          128Mi\n"
+        ),
+        "exit_code": 0,
+    },
+    ("rollout",): {
+        "success": True,
+        "output": "deployment.apps/payment-service restarted\n",
+        "exit_code": 0,
+    },
+    ("scale",): {
+        "success": True,
+        "output": "deployment.apps/payment-service scaled\n",
+        "exit_code": 0,
+    },
+})
+
+
 async def kubectl_exec(command: str) -> dict[str, Any]:
     """Execute a simulated kubectl command.
 
@@ -363,51 +418,17 @@ async def kubectl_exec(command: str) -> dict[str, Any]:
     logger.info("kubectl_exec", command=command)
 
     # Parse common commands
-    parts = command.strip().split()
+    parts = command.split()
     if not parts:
         return {"success": False, "output": "Empty command", "exit_code": 1}
 
+    # "<verb> pods" outputs take precedence over the verb-only ones
     verb = parts[0]
-
-    if verb == "get" and "pods" in command:
-        return {
-            "success": True,
-            "output": (
-                "NAME                              READY   STATUS    RESTARTS   AGE\n"
-                "payment-service-7f8d9-abc12       1/1     Running   0          2h\n"
-                "payment-service-7f8d9-def34       1/1     Running   0          2h\n"
-                "payment-service-7f8d9-ghi56       1/1     Running   3          2h\n"
-                "payment-service-7f8d9-jkl78       0/1     CrashLoopBackOff   5   2h\n"
-            ),
-            "exit_code": 0,
-        }
-
-    if verb == "top" and "pods" in command:
-        return {
-            "success": True,
-            "output": (
-                "NAME                              CPU(cores)   MEMORY(bytes)\n"
-                "payment-service-7f8d9-abc12       1847m        3421Mi\n"
-                "payment-service-7f8d9-def34       1923m        3512Mi\n"
-                "payment-service-7f8d9-ghi56       1756m        3287Mi\n"
-                "payment-service-7f8d9-jkl78       45m          128Mi\n"
-            ),
-            "exit_code": 0,
-        }
-
-    if verb == "rollout":
-        return {
-            "success": True,
-            "output": "deployment.apps/payment-service restarted\n",
-            "exit_code": 0,
-        }
-
-    if verb == "scale":
-        return {
-            "success": True,
-            "output": "deployment.apps/payment-service scaled\n",
-            "exit_code": 0,
-        }
+    result = _KUBECTL_OUTPUTS.get((verb, "pods")) if "pods" in command else None
+    if result is None:
+        result = _KUBECTL_OUTPUTS.get((verb,))
+    if result is not None:
+        return dict(result)
 
     return {
         "success": True,
@@ -6,14 +6,18 @@ duration, and success criteria for common incident remediation actions.
 
 from __future__ import annotations
 
-from typing import Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
 
 
 # ---------------------------------------------------------------------------
 # Runbook Registry
 # ---------------------------------------------------------------------------
 
-RUNBOOKS: dict[str, dict[str, Any]] = {
+RUNBOOKS: Mapping[str, dict[str, Any]] = MappingProxyType({
     "restart_service": {
         "id": "RB-001",
         "name": "Service Rolling Restart",
@@ -36,12 +40,12 @@ RUNBOOKS: dict[str, dict[str, Any]] = {
         "expected_duration_seconds": 180,
         "risk_level": "low",
         "auto_approve": True,
-        "applicable_symptoms": [
+        "applicable_symptoms": frozenset({
             "memory_leak",
             "connection_pool_exhaustion",
             "stale_cache",
             "thread_pool_exhaustion",
-        ],
+        }),
     },
     "scale_up": {
         "id": "RB-002",
@@ -67,12 +71,12 @@ RUNBOOKS: dict[str, dict[str, Any]] = {
         "expected_duration_seconds": 300,
         "risk_level": "low",
         "auto_approve": True,
-        "applicable_symptoms": [
+        "applicable_symptoms": frozenset({
             "high_cpu",
             "high_latency",
             "connection_pool_exhaustion",
             "traffic_spike",
-        ],
+        }),
     },
     "rollback_deploy": {
         "id": "RB-003",
@@ -98,12 +102,12 @@ RUNBOOKS: dict[str, dict[str, Any]] = {
         "expected_duration_seconds": 240,
         "risk_level": "medium",
         "auto_approve": False,
-        "applicable_symptoms": [
+        "applicable_symptoms": frozenset({
             "regression_after_deploy",
             "new_error_patterns",
             "config_drift",
             "performance_degradation",
-        ],
+        }),
     },
     "clear_cache": {
         "id": "RB-004",
@@ -128,11 +132,11 @@ RUNBOOKS: dict[str, dict[str, Any]] = {
         "expected_duration_seconds": 60,
         "risk_level": "low",
         "auto_approve": True,
-        "applicable_symptoms": [
+        "applicable_symptoms": frozenset({
             "stale_data",
             "inconsistent_responses",
             "serialization_errors",
-        ],
+        }),
     },
     "rotate_certs": {
         "id": "RB-005",
@@ -159,11 +163,11 @@ RUNBOOKS: dict[str, dict[str, Any]] = {
         "expected_duration_seconds": 420,
         "risk_level": "medium",
         "auto_approve": False,
-        "applicable_symptoms": [
+        "applicable_symptoms": frozenset({
             "certificate_expiry",
             "tls_handshake_failure",
             "ssl_error",
-        ],
+        }),
     },
     "drain_connections": {
         "id": "RB-006",
@@ -187,13 +191,25 @@ RUNBOOKS: dict[str, dict[str, Any]] = {
         "expected_duration_seconds": 120,
         "risk_level": "medium",
         "auto_approve": True,
-        "applicable_symptoms": [
+        "applicable_symptoms": frozenset({
             "connection_pool_exhaustion",
             "connection_timeout",
             "stale_connections",
-        ],
+        }),
     },
-}
+})
+
+
+def _index_symptoms() -> Mapping[str, str]:
+    """Map each symptom to the first runbook (in registry order) listing it."""
+    index: dict[str, str] = {}
+    for action_type, rb in RUNBOOKS.items():
+        for symptom in rb.get("applicable_symptoms", ()):
+            index.setdefault(symptom, action_type)
+    return MappingProxyType(index)
+
+
+_RUNBOOK_BY_SYMPTOM = _index_symptoms()
 
 
 def get_runbook(runbook_id: str) -> dict[str, Any] | None:
@@ -201,20 +217,25 @@ def get_runbook(runbook_id: str) -> dict[str, Any] | None:
     return RUNBOOKS.get(runbook_id)
 
 
-def list_runbooks() -> list[dict[str, Any]]:
-    """Return all available runbooks with summary info."""
-    return [
-        {
-            "action_type": key,
-            "id": rb["id"],
-            "name": rb["name"],
-            "description": rb["description"],
-            "risk_level": rb["risk_level"],
-            "auto_approve": rb["auto_approve"],
-            "expected_duration_seconds": rb["expected_duration_seconds"],
-        }
-        for key, rb in RUNBOOKS.items()
-    ]
+# Summary rows served by list_runbooks(); plain dicts so they stay
+# JSON-encodable, shared by every caller and never mutated
+_RUNBOOK_SUMMARIES: tuple[dict[str, Any], ...] = tuple(
+    {
+        "action_type": key,
+        "id": rb["id"],
+        "name": rb["name"],
+        "description": rb["description"],
+        "risk_level": rb["risk_level"],
+        "auto_approve": rb["auto_approve"],
+        "expected_duration_seconds": rb["expected_duration_seconds"],
+    }
+    for key, rb in RUNBOOKS.items()
+)
+
+
+def list_runbooks() -> tuple[dict[str, Any], ...]:
+    """Return all available runbooks with summary info (treat as read-only)."""
+    return _RUNBOOK_SUMMARIES
 
 
 def select_runbook_for_symptom(symptom: str) -> str | None:
@@ -222,7 +243,4 @@ def select_runbook_for_symptom(symptom: str) -> str | None:
 
     Returns the action_type key of the matching runbook, or None.
     """
-    for action_type, rb in RUNBOOKS.items():
-        if symptom in rb.get("applicable_symptoms", []):
-            return action_type
-    return None
+    return _RUNBOOK_BY_SYMPTOM.get(symptom)
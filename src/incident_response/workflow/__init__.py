@@ -4,4 +4,7 @@ Demonstrates ADK's three workflow agent types:
 - SequentialAgent: enrichment -> triage -> responder assignment
 - ParallelAgent: concurrent log, metric, and config diagnostics
 - LoopAgent: remediation -> verification escalation loop
+
+The ``build_*`` functions are cached: the agents keep no per-incident
+state, so each workflow is built once and shared by every pipeline run.
 """
@@ -11,11 +11,14 @@ to a human operator.
 
 from __future__ import annotations
 
+from functools import cache
+
 from incident_response.agents.base import LoopAgent
 from incident_response.agents.remediator import RemediationAgent
 from incident_response.agents.verifier import VerificationAgent
 
 
+@cache
 def build_escalation_loop(max_iterations: int = 3) -> LoopAgent:
     """Construct the remediation/verification escalation loop.
 
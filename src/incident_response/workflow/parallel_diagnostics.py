@@ -6,24 +6,27 @@ agents concurrently:
 2. MetricsCheckerAgent - check metrics for anomalies
 3. ConfigAuditorAgent - detect configuration drift
 
-All agents run simultaneously via asyncio.gather and their results
-are merged into the shared context.
+All agents run simultaneously and their results are merged into the
+shared context as each one completes.
 """
 
 from __future__ import annotations
 
+from functools import cache
+
 from incident_response.agents.base import ParallelAgent
 from incident_response.agents.config_auditor import ConfigAuditorAgent
 from incident_response.agents.log_analyzer import LogAnalyzerAgent
 from incident_response.agents.metrics_checker import MetricsCheckerAgent
 
 
+@cache
 def build_parallel_diagnostics() -> ParallelAgent:
     """Construct the parallel diagnostics pipeline.
 
     Returns:
         A ParallelAgent that runs log, metrics, and config analysis
-        concurrently using asyncio.gather.
+        concurrently.
     """
     log_analyzer = LogAnalyzerAgent()
     metrics_checker = MetricsCheckerAgent()
@@ -38,3 +41,4 @@ def build_parallel_diagnostics() -> ParallelAgent:
         ),
         sub_agents=[log_analyzer, metrics_checker, config_auditor],
     )
+
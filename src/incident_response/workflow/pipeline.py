@@ -12,8 +12,9 @@ The pipeline emits SSE events at each stage for real-time UI updates.
 
 from __future__ import annotations
 
-import uuid
+import secrets
 from datetime import datetime, timezone
+from functools import partial
 from typing import Any
 
 import structlog
@@ -45,7 +46,6 @@ from incident_response.streaming import (
     EVENT_TRIAGED,
     EVENT_TRIAGING,
     EVENT_VERIFICATION_RESULT,
-    EVENT_VERIFYING,
     IncidentEventStream,
 )
 from incident_response.workflow.escalation_loop import build_escalation_loop
@@ -54,6 +54,16 @@ from incident_response.workflow.sequential_triage import build_sequential_triage
 
 logger = structlog.get_logger(__name__)
 
+# Current UTC timestamp, with ``datetime.now`` and the tz pre-bound
+_now = partial(datetime.now, timezone.utc)
+
+# (context key, summary label) for each parallel diagnostic's result
+_DIAGNOSTIC_KEYS = (
+    ("log_diagnostics", "logs"),
+    ("metrics_diagnostics", "metrics"),
+    ("config_diagnostics", "config"),
+)
+
 
 async def run_incident_pipeline(
     alert: Alert,
@@ -95,6 +105,7 @@ async def run_incident_pipeline(
         "alert": alert,
         "session_id": session_id,
         "timeline": [],
+        "_delay_scale": settings.remediation_delay_scale,
     }
 
     timeline: list[dict[str, Any]] = context["timeline"]
@@ -125,18 +136,22 @@ async def run_incident_pipeline(
         triage_pipeline = build_sequential_triage()
         context = await triage_pipeline.run(context)
 
+        # Triage outputs read by several events below; bind them once
+        owner_team = context.get("_shared", {}).get("owner_team", "")
+        severity: SeverityLevel = context.get("severity", SeverityLevel.P4)
+        reasoning = context.get("triage_reasoning", "")
+        assigned_responder = context.get("assigned_responder", {})
+
         await event_stream.emit(
             session_id,
             EVENT_ENRICHED,
             data={
-                "owner_team": context.get("owner_team", ""),
+                "owner_team": owner_team,
                 "recent_deploys": len(
-                    context.get("incident_context", {}).recent_deploys
-                    if hasattr(context.get("incident_context", {}), "recent_deploys")
-                    else []
+                    getattr(context.get("incident_context"), "recent_deploys", ())
                 ),
             },
-            message=f"Context enriched. Owner team: {context.get('owner_team', 'unknown')}",
+            message=f"Context enriched. Owner team: {owner_team or 'unknown'}",
         )
         _add_timeline(timeline, "enrichment_complete", "Context enrichment complete")
 
@@ -147,16 +162,13 @@ async def run_incident_pipeline(
             message="Classifying incident severity...",
         )
 
-        severity: SeverityLevel = context.get("severity", SeverityLevel.P4)
-        reasoning = context.get("triage_reasoning", "")
-
         await event_stream.emit(
             session_id,
             EVENT_TRIAGED,
             data={
                 "severity": severity.value,
                 "reasoning": reasoning,
-                "assigned_responder": context.get("assigned_responder", {}),
+                "assigned_responder": assigned_responder,
                 "escalation_level": context.get("escalation_level", EscalationLevel.L1_AUTO).value,
             },
             message=f"Severity classified as {severity.value}. {reasoning[:200]}",
@@ -164,29 +176,31 @@ async def run_incident_pipeline(
         _add_timeline(
             timeline,
             "triage_complete",
-            f"Severity: {severity.value}, Responder: {context.get('assigned_responder', {}).get('name', 'N/A')}",
+            f"Severity: {severity.value}, Responder: {assigned_responder.get('name', 'N/A')}",
         )
 
         # ------------------------------------------------------------------
         # Phase 2: Parallel Diagnostics (logs + metrics + config)
         # ------------------------------------------------------------------
-        await event_stream.emit(
-            session_id,
-            EVENT_DIAGNOSING_LOGS,
-            data={"service": alert.service},
-            message="Analyzing application logs...",
-        )
-        await event_stream.emit(
-            session_id,
-            EVENT_DIAGNOSING_METRICS,
-            data={"service": alert.service},
-            message="Checking infrastructure metrics...",
-        )
-        await event_stream.emit(
+        await event_stream.emit_batch(
             session_id,
-            EVENT_DIAGNOSING_CONFIG,
-            data={"service": alert.service},
-            message="Auditing service configuration...",
+            [
+                (
+                    EVENT_DIAGNOSING_LOGS,
+                    {"service": alert.service},
+                    "Analyzing application logs...",
+                ),
+                (
+                    EVENT_DIAGNOSING_METRICS,
+                    {"service": alert.service},
+                    "Checking infrastructure metrics...",
+                ),
+                (
+                    EVENT_DIAGNOSING_CONFIG,
+                    {"service": alert.service},
+                    "Auditing service configuration...",
+                ),
+            ],
         )
         _add_timeline(timeline, "diagnostics_started", "Parallel diagnostics started")
 
@@ -195,16 +209,15 @@ async def run_incident_pipeline(
 
         # Collect diagnostic summaries
         diag_summary: dict[str, Any] = {}
-        for key, label in [
-            ("log_diagnostics", "logs"),
-            ("metrics_diagnostics", "metrics"),
-            ("config_diagnostics", "config"),
-        ]:
+        total_anomalies = 0
+        for key, label in _DIAGNOSTIC_KEYS:
             diag: DiagnosticResult | None = context.get(key)
             if diag and isinstance(diag, DiagnosticResult):
+                anomaly_count = len(diag.anomalies)
+                total_anomalies += anomaly_count
                 diag_summary[label] = {
                     "findings": len(diag.findings),
-                    "anomalies": len(diag.anomalies),
+                    "anomalies": anomaly_count,
                     "severity_indicators": diag.severity_indicators,
                 }
 
@@ -217,7 +230,7 @@ async def run_incident_pipeline(
         _add_timeline(
             timeline,
             "diagnostics_complete",
-            f"Diagnostics: {sum(d.get('anomalies', 0) for d in diag_summary.values())} total anomalies",
+            f"Diagnostics: {total_anomalies} total anomalies",
         )
 
         # ------------------------------------------------------------------
@@ -236,33 +249,32 @@ async def run_incident_pipeline(
         )
         context = await escalation_loop.run(context)
 
-        # Emit events for each remediation action taken
+        # Emit one event per remediation action taken, then the verdict of
+        # the loop's last verification, as a single group
         remediation_actions: list[RemediationAction] = context.get("remediation_actions", [])
-        for action in remediation_actions:
-            await event_stream.emit(
-                session_id,
-                EVENT_REMEDIATION_ATTEMPTED,
-                data={
-                    "action_type": action.action_type,
-                    "success": action.success,
-                    "output": action.output[:500],
-                },
-                message=f"Remediation: {action.action_type} - {'success' if action.success else 'failed'}",
-            )
-
-        # Emit verification result
         verification = context.get("verification_result", {})
-        await event_stream.emit(
-            session_id,
-            EVENT_VERIFYING,
-            data={"service": alert.service},
-            message="Verifying service health...",
-        )
-        await event_stream.emit(
+        await event_stream.emit_batch(
             session_id,
-            EVENT_VERIFICATION_RESULT,
-            data=verification,
-            message=f"Verification: {verification.get('verdict', 'UNKNOWN')}",
+            [
+                *(
+                    (
+                        EVENT_REMEDIATION_ATTEMPTED,
+                        {
+                            "action_type": action.action_type,
+                            "success": action.success,
+                            "output": action.output[:500],
+                        },
+                        f"Remediation: {action.action_type} - "
+                        f"{'success' if action.success else 'failed'}",
+                    )
+                    for action in remediation_actions
+                ),
+                (
+                    EVENT_VERIFICATION_RESULT,
+                    verification,
+                    f"Verification: {verification.get('verdict', 'UNKNOWN')}",
+                ),
+            ],
         )
 
         # ------------------------------------------------------------------
@@ -322,7 +334,7 @@ async def run_incident_pipeline(
                 data={
                     "severity": severity.value,
                     "escalation_level": escalation_level.value,
-                    "assigned_responder": context.get("assigned_responder", {}),
+                    "assigned_responder": assigned_responder,
                     "attempts": settings.max_escalation_levels,
                 },
                 message=(
@@ -365,7 +377,7 @@ def _build_report(
     remediation_actions: list[RemediationAction] = context.get("remediation_actions", [])
     diagnostics: list[DiagnosticResult] = []
 
-    for key in ["log_diagnostics", "metrics_diagnostics", "config_diagnostics"]:
+    for key, _ in _DIAGNOSTIC_KEYS:
         diag = context.get(key)
         if diag and isinstance(diag, DiagnosticResult):
             diagnostics.append(diag)
@@ -398,16 +410,18 @@ def _build_report(
             f"Escalated to {context.get('escalation_level', EscalationLevel.L4_MANAGEMENT).value}."
         )
 
-    return IncidentReport(
-        id=f"RPT-{uuid.uuid4().hex[:8].upper()}",
+    # Fields are built locally with the right types; skip re-validation.
+    # Copy the lists the workflow keeps appending to after the report.
+    return IncidentReport.model_construct(
+        id=f"RPT-{secrets.token_hex(4).upper()}",
         session_id=session_id,
         alert=alert,
         severity=severity,
         diagnostics=diagnostics,
-        remediations=remediation_actions,
+        remediations=list(remediation_actions),
         escalation_history=escalation_history,
         resolution_summary=resolution_summary,
-        timeline=context.get("timeline", []),
+        timeline=list(context.get("timeline", ())),
     )
 
 
@@ -420,5 +434,5 @@ def _add_timeline(
     timeline.append({
         "event": event,
         "description": description,
-        "timestamp": datetime.now(tz=timezone.utc).isoformat(),
+        "timestamp": _now().isoformat(),
     })
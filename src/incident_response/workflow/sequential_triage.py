@@ -10,12 +10,15 @@ Each agent receives the output context of the previous agent.
 
 from __future__ import annotations
 
+from functools import cache
+
 from incident_response.agents.base import SequentialAgent
 from incident_response.agents.enricher import ContextEnricherAgent
 from incident_response.agents.responder import ResponderAssignerAgent
 from incident_response.agents.triage import TriageAgent
 
 
+@cache
 def build_sequential_triage() -> SequentialAgent:
     """Construct the sequential triage pipeline.
 
@@ -6,7 +6,7 @@ carrying all accumulated data from enrichment through resolution.
 
 from __future__ import annotations
 
-from typing import Any, TypedDict
+from typing import TYPE_CHECKING, Any, TypedDict
 
 from incident_response.models import (
     DiagnosticResult,
@@ -17,6 +17,9 @@ from incident_response.models import (
     SeverityLevel,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
 
 class IncidentWorkflowState(TypedDict, total=False):
     """Full state passed through the incident response workflow.
@@ -32,8 +35,8 @@ class IncidentWorkflowState(TypedDict, total=False):
 
     # --- Enrichment (SequentialAgent stage 1) ---
     incident_context: IncidentContext
-    service_info: dict[str, Any]
-    owner_team: str
+    # Read-only: service_info, owner_team, oncall, service_deps
+    _shared: Mapping[str, Any]
 
     # --- Triage (SequentialAgent stage 2) ---
     severity: SeverityLevel
@@ -41,7 +44,7 @@ class IncidentWorkflowState(TypedDict, total=False):
 
     # --- Responder assignment (SequentialAgent stage 3) ---
     assigned_responder: dict[str, Any]
-    escalation_path: list[dict[str, Any]]
+    escalation_path: tuple[Mapping[str, Any], ...]
     escalation_level: EscalationLevel
     notification_channels: list[str]
 
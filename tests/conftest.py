@@ -3,23 +3,30 @@
 from __future__ import annotations
 
 import os
+from typing import TYPE_CHECKING
 
 import pytest
+import pytest_asyncio
 
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
 
-@pytest.fixture(autouse=True)
-def _test_env(monkeypatch: pytest.MonkeyPatch) -> None:
-    """Set up test environment variables."""
-    monkeypatch.setenv("ENVIRONMENT", "testing")
-    monkeypatch.setenv("LOG_LEVEL", "DEBUG")
-    for key in ("OPENAI_API_KEY", "ANTHROPIC_API_KEY", "GOOGLE_API_KEY"):
-        monkeypatch.delenv(key, raising=False)
+# Test environment, set once when conftest is loaded so it is already in
+# place for anything imported during collection. Tests that need a
+# different value should use monkeypatch locally.
+os.environ["ENVIRONMENT"] = "testing"
+os.environ["LOG_LEVEL"] = "DEBUG"
+for _key in ("OPENAI_API_KEY", "ANTHROPIC_API_KEY", "GOOGLE_API_KEY"):
+    os.environ.pop(_key, None)
 
 
-@pytest.fixture()
+# The app is built once per run; every API test submits its own alerts and
+# gets its own session ids, so tests do not see each other's state.
+
+
+@pytest.fixture(scope="session")
 def settings():
     """Create test settings."""
-    os.environ.setdefault("ENVIRONMENT", "testing")
     from incident_response.config import Settings
 
     return Settings(
@@ -28,7 +35,7 @@ def settings():
     )
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def app(settings):
     """Create a test FastAPI application."""
     from incident_response.api import create_app
@@ -36,10 +43,31 @@ def app(settings):
     return create_app(settings)
 
 
-@pytest.fixture()
-def client(app):
-    """Create an async test client."""
+@pytest_asyncio.fixture(scope="session")
+async def client(app) -> AsyncIterator:
+    """Create an async test client, closed once the run finishes."""
     from httpx import ASGITransport, AsyncClient
 
     transport = ASGITransport(app=app)
-    return AsyncClient(transport=transport, base_url="http://test")
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+def _make_alert(**overrides) -> dict:
+    """Build the canonical ``POST /api/v1/incidents`` body."""
+    body = {
+        "source": "prometheus",
+        "title": "High CPU on payment-service",
+        "description": "CPU usage exceeded 95% for 5 minutes",
+        "service": "payment-service",
+        "host": "k8s-node-01",
+        "raw_data": {"cpu_percent": 97.5, "duration_minutes": 5},
+    }
+    body.update(overrides)
+    return body
+
+
+@pytest.fixture
+def make_alert():
+    """Alert payload builder; keyword arguments override canonical fields."""
+    return _make_alert
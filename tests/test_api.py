@@ -2,9 +2,22 @@
 
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 
 
+async def _wait_for_event(app, session_id: str, event_type: str, timeout: float = 2.0) -> None:
+    """Wait until the session's pipeline has emitted *event_type*."""
+
+    async def watch() -> None:
+        async for event in app.state.app_state.event_stream.subscribe(session_id):
+            if event.event_type == event_type:
+                return
+
+    await asyncio.wait_for(watch(), timeout)
+
+
 @pytest.mark.asyncio
 async def test_health(client):
     """Health endpoint returns service info."""
@@ -15,20 +28,23 @@ async def test_health(client):
     assert data["service"] == "incident-response-adk"
 
 
+@pytest.fixture
+def create_incident(app, client, make_alert):
+    """Submit an alert built from *overrides*, wait for triage, return its session id."""
+
+    async def create(**overrides) -> str:
+        resp = await client.post("/api/v1/incidents", json=make_alert(**overrides))
+        session_id = resp.json()["session_id"]
+        await _wait_for_event(app, session_id, "triaged")
+        return session_id
+
+    return create
+
+
 @pytest.mark.asyncio
-async def test_create_incident(client):
+async def test_create_incident(client, make_alert):
     """Submit an alert for automated incident response."""
-    resp = await client.post(
-        "/api/v1/incidents",
-        json={
-            "source": "prometheus",
-            "title": "High CPU on payment-service",
-            "description": "CPU usage exceeded 95% for 5 minutes",
-            "service": "payment-service",
-            "host": "k8s-node-01",
-            "raw_data": {"cpu_percent": 97.5, "duration_minutes": 5},
-        },
-    )
+    resp = await client.post("/api/v1/incidents", json=make_alert())
     assert resp.status_code == 200
     data = resp.json()
     assert "session_id" in data
@@ -36,23 +52,15 @@ async def test_create_incident(client):
 
 
 @pytest.mark.asyncio
-async def test_get_incident(client):
+async def test_get_incident(client, create_incident):
     """Get incident status after creation."""
-    create_resp = await client.post(
-        "/api/v1/incidents",
-        json={
-            "source": "datadog",
-            "title": "OOM on order-processor",
-            "description": "Container killed due to memory limit",
-            "service": "order-processor",
-            "host": "k8s-node-02",
-            "raw_data": {"memory_mb": 2048, "limit_mb": 2048},
-        },
+    session_id = await create_incident(
+        source="datadog",
+        title="OOM on order-processor",
+        description="Container killed due to memory limit",
+        service="order-processor",
+        raw_data={"memory_mb": 2048, "limit_mb": 2048},
     )
-    session_id = create_resp.json()["session_id"]
-
-    import asyncio
-    await asyncio.sleep(0.5)
 
     resp = await client.get(f"/api/v1/incidents/{session_id}")
     assert resp.status_code == 200
@@ -68,12 +76,21 @@ async def test_get_nonexistent_incident(client):
 
 
 @pytest.mark.asyncio
-async def test_list_incidents(client):
-    """List all incidents."""
+async def test_list_incidents(client, make_alert):
+    """List incidents; ``total`` counts every match, not just the page."""
+    for _ in range(2):
+        await client.post("/api/v1/incidents", json=make_alert())
+
     resp = await client.get("/api/v1/incidents")
     assert resp.status_code == 200
     data = resp.json()
     assert "incidents" in data
+    assert data["total"] == len(data["incidents"]) >= 2
+
+    resp = await client.get("/api/v1/incidents", params={"limit": 1})
+    page = resp.json()
+    assert len(page["incidents"]) == 1
+    assert page["total"] >= data["total"]
 
 
 @pytest.mark.asyncio
@@ -87,23 +104,15 @@ async def test_list_runbooks(client):
 
 
 @pytest.mark.asyncio
-async def test_resolve_incident(client):
-    """Resolve an incident."""
-    create_resp = await client.post(
-        "/api/v1/incidents",
-        json={
-            "source": "test",
-            "title": "Test alert",
-            "description": "Test",
-            "service": "test-service",
-            "host": "test-host",
-            "raw_data": {},
-        },
+async def test_resolve_incident(client, create_incident):
+    """Resolve an incident for a service missing from the registry."""
+    session_id = await create_incident(
+        source="test",
+        title="Test alert",
+        description="Test",
+        service="test-service",
+        raw_data={},
     )
-    session_id = create_resp.json()["session_id"]
-
-    import asyncio
-    await asyncio.sleep(1.0)
 
     resp = await client.post(
         f"/api/v1/incidents/{session_id}/resolve",
@@ -113,26 +122,118 @@ async def test_resolve_incident(client):
 
 
 @pytest.mark.asyncio
-async def test_human_takeover(client):
+async def test_human_takeover(client, create_incident):
     """Human takes over from automated response."""
+    session_id = await create_incident(
+        source="test",
+        title="Complex issue",
+        description="Requires human investigation",
+        service="auth-service",
+        raw_data={},
+    )
+
+    resp = await client.post(
+        f"/api/v1/incidents/{session_id}/takeover",
+        json={"operator": "test-engineer", "reason": "Manual investigation needed"},
+    )
+    assert resp.status_code in (200, 400)
+
+
+@pytest.mark.asyncio
+async def test_sessions_list_newest_first():
+    """Unfiltered listings are newest-first and honour the limit."""
+    from incident_response.api import SessionManager
+    from incident_response.mock_data.alerts import MOCK_ALERTS
+
+    manager = SessionManager()
+    first = await manager.create_session(MOCK_ALERTS[0])
+    second = await manager.create_session(MOCK_ALERTS[1])
+
+    assert [s.id for s in manager.list_sessions()] == [second.id, first.id]
+    assert [s.id for s in manager.list_sessions(limit=1)] == [second.id]
+    assert manager.count_sessions() == 2
+
+
+@pytest.mark.asyncio
+async def test_session_filters_follow_updates():
+    """State and severity filters reflect the latest session updates."""
+    from incident_response.api import SessionManager
+    from incident_response.mock_data.alerts import MOCK_ALERTS
+    from incident_response.models import IncidentState, SeverityLevel
+
+    manager = SessionManager()
+    first = await manager.create_session(MOCK_ALERTS[0])
+    second = await manager.create_session(MOCK_ALERTS[1])
+    manager.update_session(first.id, state=IncidentState.RESOLVED, severity=SeverityLevel.P1)
+
+    assert [s.id for s in manager.list_sessions(state=IncidentState.RESOLVED)] == [first.id]
+    assert manager.list_sessions(state=IncidentState.RESOLVED, severity=SeverityLevel.P4) == []
+    assert [s.id for s in manager.list_sessions(severity=SeverityLevel.P4)] == [second.id]
+    assert manager.count_sessions(state=IncidentState.RESOLVED) == 1
+    assert manager.count_sessions(state=IncidentState.RESOLVED, severity=SeverityLevel.P4) == 0
+
+
+@pytest.mark.asyncio
+async def test_session_json_refreshes_after_update():
+    """A session's cached JSON is reused until the session changes."""
+    from incident_response.api import SessionManager
+    from incident_response.mock_data.alerts import MOCK_ALERTS
+
+    manager = SessionManager()
+    session = await manager.create_session(MOCK_ALERTS[0])
+
+    cached = manager.session_json(session)
+    assert manager.session_json(session) is cached
+    manager.update_session(session.id, error="boom")
+    assert '"error":"boom"' in manager.session_json(session)
+
+
+@pytest.mark.asyncio
+async def test_expired_sessions_are_evicted_with_their_pipelines():
+    """Sessions past the TTL are dropped and their running pipelines cancelled."""
+    from datetime import datetime, timedelta, timezone
+
+    from incident_response.api import SessionManager
+    from incident_response.mock_data.alerts import MOCK_ALERTS
+    from incident_response.models import IncidentState
+
+    manager = SessionManager(ttl_seconds=60)
+    first = await manager.create_session(MOCK_ALERTS[0])
+    second = await manager.create_session(MOCK_ALERTS[1])
+    manager.update_session(first.id, state=IncidentState.RESOLVED)
+    pipeline = asyncio.ensure_future(asyncio.sleep(10))
+    manager.track_pipeline(first.id, pipeline)
+
+    assert manager.evict_expired() == []
+
+    later = datetime.now(tz=timezone.utc) + timedelta(seconds=61)
+    assert manager.evict_expired(now=later) == [first.id, second.id]
+    assert manager.get_session(first.id) is None
+    assert manager.list_sessions() == []
+    assert manager.list_sessions(state=IncidentState.RESOLVED) == []
+    await asyncio.sleep(0)
+    assert pipeline.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_escalate_rejects_unknown_level(client):
+    """Unknown escalation levels are a 400 listing the valid values."""
     create_resp = await client.post(
         "/api/v1/incidents",
-        json={
-            "source": "test",
-            "title": "Complex issue",
-            "description": "Requires human investigation",
-            "service": "auth-service",
-            "host": "test-host",
-            "raw_data": {},
-        },
+        json={"title": "Test alert", "service": "test-service"},
     )
     session_id = create_resp.json()["session_id"]
 
-    import asyncio
-    await asyncio.sleep(0.5)
+    resp = await client.post(
+        f"/api/v1/incidents/{session_id}/escalate",
+        json={"level": "L9_NOBODY"},
+    )
+    assert resp.status_code == 400
+    assert "L3_SENIOR" in resp.json()["detail"]
 
     resp = await client.post(
-        f"/api/v1/incidents/{session_id}/takeover",
-        json={"operator": "test-engineer", "reason": "Manual investigation needed"},
+        f"/api/v1/incidents/{session_id}/escalate",
+        json={"level": "L2_ONCALL", "reason": "test"},
     )
-    assert resp.status_code in (200, 400)
+    assert resp.status_code == 200
+    assert resp.json()["escalation_level"] == "L2_ONCALL"
@@ -60,13 +60,35 @@ async def test_triage_agent():
     assert result["severity"] in (SeverityLevel.P1, SeverityLevel.P2)
 
 
+@pytest.fixture(scope="module")
+def log_analyzer_agent():
+    """One LogAnalyzerAgent shared by the module (agents keep no run state)."""
+    from incident_response.agents.log_analyzer import LogAnalyzerAgent
+
+    return LogAnalyzerAgent()
+
+
+@pytest.fixture(scope="module")
+def metrics_checker_agent():
+    """One MetricsCheckerAgent shared by the module."""
+    from incident_response.agents.metrics_checker import MetricsCheckerAgent
+
+    return MetricsCheckerAgent()
+
+
+@pytest.fixture(scope="module")
+def config_auditor_agent():
+    """One ConfigAuditorAgent shared by the module."""
+    from incident_response.agents.config_auditor import ConfigAuditorAgent
+
+    return ConfigAuditorAgent()
+
+
 @pytest.mark.asyncio
-async def test_log_analyzer():
+async def test_log_analyzer(log_analyzer_agent):
     """LogAnalyzerAgent finds correlated errors."""
-    from incident_response.agents.log_analyzer import LogAnalyzerAgent
     from incident_response.models import Alert
 
-    agent = LogAnalyzerAgent()
     alert = Alert(
         id="alert-log-test",
         source="prometheus",
@@ -75,17 +97,15 @@ async def test_log_analyzer():
         service="payment-service",
         host="node-01",
     )
-    result = await agent.run({"alert": alert})
+    result = await log_analyzer_agent.run({"alert": alert})
     assert "log_diagnostics" in result
 
 
 @pytest.mark.asyncio
-async def test_metrics_checker():
+async def test_metrics_checker(metrics_checker_agent):
     """MetricsCheckerAgent detects anomalies."""
-    from incident_response.agents.metrics_checker import MetricsCheckerAgent
     from incident_response.models import Alert
 
-    agent = MetricsCheckerAgent()
     alert = Alert(
         id="alert-metrics-test",
         source="prometheus",
@@ -94,17 +114,15 @@ async def test_metrics_checker():
         service="payment-service",
         host="node-01",
     )
-    result = await agent.run({"alert": alert})
+    result = await metrics_checker_agent.run({"alert": alert})
     assert "metrics_diagnostics" in result
 
 
 @pytest.mark.asyncio
-async def test_config_auditor():
+async def test_config_auditor(config_auditor_agent):
     """ConfigAuditorAgent detects config drift."""
-    from incident_response.agents.config_auditor import ConfigAuditorAgent
     from incident_response.models import Alert
 
-    agent = ConfigAuditorAgent()
     alert = Alert(
         id="alert-config-test",
         source="prometheus",
@@ -113,19 +131,62 @@ async def test_config_auditor():
         service="payment-service",
         host="node-01",
     )
-    result = await agent.run({"alert": alert})
+    result = await config_auditor_agent.run({"alert": alert})
     assert "config_diagnostics" in result
 
 
+@pytest.mark.asyncio
+async def test_diagnostic_agents_run_concurrently_on_shared_view(
+    log_analyzer_agent, metrics_checker_agent, config_auditor_agent
+):
+    """The three diagnostic agents can fan out over one read-only context."""
+    from types import MappingProxyType
+
+    from incident_response.models import Alert
+
+    alert = Alert(
+        id="alert-parallel-test",
+        source="prometheus",
+        title="Error rate and latency spike",
+        description="Errors and p99 latency up on payment-service",
+        service="payment-service",
+        host="node-01",
+    )
+    shared = MappingProxyType({"alert": alert})
+    log_res, metrics_res, config_res = await asyncio.gather(
+        log_analyzer_agent.run(shared),
+        metrics_checker_agent.run(shared),
+        config_auditor_agent.run(shared),
+    )
+    # Each returns only its own output for ParallelAgent to merge
+    assert log_res.keys() == {"log_diagnostics"}
+    assert metrics_res.keys() == {"metrics_diagnostics"}
+    assert config_res.keys() == {"config_diagnostics"}
+    assert dict(shared) == {"alert": alert}
+
+
 @pytest.mark.asyncio
 async def test_mock_alerts():
-    """Mock data provides realistic alerts."""
-    from incident_response.mock_data.alerts import MOCK_ALERTS
+    """Mock data provides realistic alerts, indexed by id and service."""
+    from incident_response.mock_data.alerts import (
+        MOCK_ALERTS,
+        get_alert_by_id,
+        get_alerts_by_service,
+    )
 
     assert len(MOCK_ALERTS) >= 5
     services = {a.service for a in MOCK_ALERTS}
     assert len(services) >= 3
 
+    for alert in MOCK_ALERTS:
+        assert get_alert_by_id(alert.id) is alert
+    for service in services:
+        assert get_alerts_by_service(service) == tuple(
+            a for a in MOCK_ALERTS if a.service == service
+        )
+    assert get_alert_by_id("alert-missing") is None
+    assert get_alerts_by_service("no-such-service") == ()
+
 
 @pytest.mark.asyncio
 async def test_mock_infrastructure():
@@ -133,3 +194,395 @@ async def test_mock_infrastructure():
     from incident_response.mock_data.infrastructure import SERVICE_REGISTRY
 
     assert len(SERVICE_REGISTRY) >= 5
+
+
+@pytest.mark.asyncio
+async def test_parallel_agent_short_circuit_cancels_pending():
+    """ParallelAgent stops waiting once short_circuit is satisfied."""
+    from incident_response.agents.base import BaseAgent, ParallelAgent
+
+    class _Fast(BaseAgent):
+        async def run(self, context):
+            return {"fast": True}
+
+    class _Slow(BaseAgent):
+        async def run(self, context):
+            await asyncio.sleep(10)
+            return {"slow": True}
+
+    agent = ParallelAgent(
+        name="parallel",
+        sub_agents=[_Slow("slow"), _Fast("fast")],
+        short_circuit=lambda merged: merged.get("fast", False),
+    )
+    result = await asyncio.wait_for(agent.run({"seed": 1}), timeout=2)
+    assert result["fast"] is True
+    assert result["seed"] == 1
+    assert "slow" not in result
+    assert result["errors"] == {"slow": "cancelled: short-circuited by fast"}
+
+
+@pytest.mark.asyncio
+async def test_parallel_diagnostics_keeps_every_agents_evidence():
+    """The diagnostics stage waits for all three agents, even on critical drift."""
+    from incident_response.mock_data.alerts import get_alert_by_id
+    from incident_response.workflow.parallel_diagnostics import build_parallel_diagnostics
+
+    alert = get_alert_by_id("ALT-002")
+    result = await build_parallel_diagnostics().run({"alert": alert})
+    assert {"log_diagnostics", "metrics_diagnostics", "config_diagnostics"} <= result.keys()
+    assert "errors" not in result
+
+
+@pytest.mark.asyncio
+async def test_sequential_agent_leaves_input_context_untouched():
+    """SequentialAgent writes into a layered view and returns a plain dict."""
+    from incident_response.agents.base import BaseAgent, SequentialAgent
+
+    class _Writer(BaseAgent):
+        async def run(self, context):
+            context[self.name] = True
+            return context
+
+    original = {"seed": 1}
+    agent = SequentialAgent(name="seq", sub_agents=[_Writer("a"), _Writer("b")])
+    result = await agent.run(original)
+    assert type(result) is dict
+    assert result == {"seed": 1, "a": True, "b": True}
+    assert original == {"seed": 1}
+
+
+@pytest.mark.asyncio
+async def test_log_analyzer_queries_dependencies():
+    """LogAnalyzerAgent reports dependency log errors alongside the primary."""
+    from incident_response.agents.log_analyzer import LogAnalyzerAgent
+    from incident_response.models import Alert
+
+    alert = Alert(
+        id="alert-log-deps",
+        source="prometheus",
+        title="High error rate",
+        description="Error rate spike on api-gateway",
+        service="api-gateway",
+    )
+    context = {"alert": alert, "_shared": {"service_deps": ("payment-service",)}}
+    result = await LogAnalyzerAgent().run(context)
+    findings = result["log_diagnostics"].findings
+    assert any(f.startswith("Dependency payment-service:") for f in findings)
+
+
+@pytest.mark.asyncio
+async def test_loop_agent_defensive_copy():
+    """LoopAgent updates the caller's context unless defensive_copy is set."""
+    from incident_response.agents.base import BaseAgent, LoopAgent
+
+    class _Done(BaseAgent):
+        async def run(self, context):
+            context["loop_complete"] = True
+            return context
+
+    shared = {"seed": 1}
+    await LoopAgent(name="loop", sub_agents=[_Done("done")]).run(shared)
+    assert shared["loop_complete"] is True
+
+    original = {"seed": 1}
+    result = await LoopAgent(
+        name="loop", sub_agents=[_Done("done")], defensive_copy=True
+    ).run(original)
+    assert result["loop_complete"] is True
+    assert original == {"seed": 1}
+
+
+@pytest.mark.asyncio
+async def test_config_auditor_compliant_result():
+    """A compliant service gets a no-drift result of its own on every audit."""
+    from incident_response.agents.config_auditor import ConfigAuditorAgent
+    from incident_response.models import Alert
+
+    agent = ConfigAuditorAgent()
+    alert = Alert(
+        id="alert-config-ok",
+        source="prometheus",
+        title="Latency blip",
+        description="Short latency blip on db-proxy",
+        service="db-proxy",
+    )
+    first = (await agent.run({"alert": alert}))["config_diagnostics"]
+    second = (await agent.run({"alert": alert}))["config_diagnostics"]
+    assert first is not second
+    assert first.findings is not second.findings
+    assert first.severity_indicators == []
+    assert first.findings[0].startswith("No configuration drift detected")
+
+
+def test_action_table_matches_runbook_lookup():
+    """The precomputed action table picks the same runbook as a live lookup."""
+    from incident_response.agents.remediator import (
+        ACTION_PRIORITY_BY_ITERATION,
+        INDICATOR_TO_SYMPTOM,
+        _select_action,
+    )
+    from incident_response.tools.runbooks import select_runbook_for_symptom
+
+    for iteration in (1, 2, 3, 4):
+        candidates = ACTION_PRIORITY_BY_ITERATION.get(iteration, ("restart_service",))
+        for indicator, symptom in INDICATOR_TO_SYMPTOM.items():
+            expected = select_runbook_for_symptom(symptom)
+            if expected not in candidates:
+                if symptom == "config_drift" and iteration >= 2:
+                    expected = "rollback_deploy"
+                else:
+                    expected = candidates[0]
+            assert _select_action("svc", [indicator], iteration, {}) == expected
+
+
+def test_keyword_classification_tier_precedence():
+    """The highest-severity tier wins regardless of keyword position."""
+    from incident_response.agents.triage import _classify_by_keywords
+    from incident_response.models import SeverityLevel
+
+    assert _classify_by_keywords("slow latency then full outage") == (
+        SeverityLevel.P1,
+        "outage",
+    )
+    assert _classify_by_keywords("latency spike")[0] == SeverityLevel.P2
+    assert _classify_by_keywords("consumer lag growing")[0] == SeverityLevel.P3
+    assert _classify_by_keywords("all good") == (SeverityLevel.P4, "")
+
+
+@pytest.mark.asyncio
+async def test_event_payload_serialized_once_for_all_subscribers():
+    """Every subscriber receives the same cached SSE payload."""
+    import json
+
+    from pydantic import ValidationError
+
+    from incident_response.streaming import EVENT_RESOLVED, IncidentEventStream
+
+    stream = IncidentEventStream()
+    event = await stream.emit("sess-1", EVENT_RESOLVED, data={"ok": True})
+
+    assert event.sse_data is event.sse_data
+    assert json.loads(event.sse_data)["data"] == {"ok": True}
+    assert "sse_data" not in event.model_dump()
+    with pytest.raises(ValidationError):
+        event.message = "changed"
+    async for replayed in stream.subscribe("sess-1"):
+        assert replayed.sse_data is event.sse_data
+        break
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_drops_oldest_events():
+    """A lagging subscriber skips trimmed events but still gets the terminal one."""
+    from incident_response.streaming import (
+        EVENT_ENRICHING,
+        EVENT_RESOLVED,
+        IncidentEventStream,
+    )
+
+    stream = IncidentEventStream(max_history=2)
+    subscriber = stream.subscribe("sess-1")
+    pending = asyncio.ensure_future(anext(subscriber))
+    await asyncio.sleep(0)
+
+    first = await stream.emit("sess-1", EVENT_ENRICHING, message="1")
+    assert await pending is first
+    for n in range(2, 6):
+        await stream.emit("sess-1", EVENT_ENRICHING, message=str(n))
+    await stream.emit("sess-1", EVENT_RESOLVED)
+
+    received = [event async for event in subscriber]
+    assert [e.message for e in received] == ["5", ""]
+    assert received[-1].event_type == EVENT_RESOLVED
+
+
+@pytest.mark.asyncio
+async def test_batched_subscription_coalesces_bursts():
+    """Events emitted within the window arrive as one batch."""
+    from incident_response.streaming import (
+        EVENT_ENRICHING,
+        EVENT_RESOLVED,
+        EVENT_TRIAGING,
+        IncidentEventStream,
+    )
+
+    stream = IncidentEventStream()
+    batches = stream.subscribe_batched("sess-1", window=0.05)
+    pending = asyncio.ensure_future(anext(batches))
+    await asyncio.sleep(0)
+
+    await stream.emit("sess-1", EVENT_ENRICHING)
+    await stream.emit("sess-1", EVENT_TRIAGING)
+    first = await pending
+    assert [e.event_type for e in first] == [EVENT_ENRICHING, EVENT_TRIAGING]
+
+    await stream.emit("sess-1", EVENT_RESOLVED)
+    await stream.emit("sess-1", EVENT_ENRICHING)
+    rest = [batch async for batch in batches]
+    assert [[e.event_type for e in b] for b in rest] == [[EVENT_RESOLVED]]
+
+
+@pytest.mark.asyncio
+async def test_emit_batch_wakes_subscribers_once():
+    """emit_batch appends events in order and wakes a batched reader once."""
+    from incident_response.streaming import (
+        EVENT_DIAGNOSING_CONFIG,
+        EVENT_DIAGNOSING_LOGS,
+        EVENT_RESOLVED,
+        IncidentEventStream,
+    )
+
+    stream = IncidentEventStream()
+    batches = stream.subscribe_batched("sess-1", window=0)
+    pending = asyncio.ensure_future(anext(batches))
+    await asyncio.sleep(0)
+
+    emitted = await stream.emit_batch(
+        "sess-1",
+        [
+            (EVENT_DIAGNOSING_LOGS, {"service": "db-proxy"}, "logs"),
+            (EVENT_DIAGNOSING_CONFIG, None, "config"),
+            (EVENT_RESOLVED, None, ""),
+        ],
+    )
+    assert await pending == emitted
+    assert [e.message for e in emitted] == ["logs", "config", ""]
+    assert emitted[1].data == {}
+
+
+@pytest.mark.asyncio
+async def test_batched_subscription_replays_history_in_chunks():
+    """Late joiners get retained history in max_batch-sized batches."""
+    from incident_response.streaming import (
+        EVENT_ENRICHING,
+        EVENT_RESOLVED,
+        IncidentEventStream,
+    )
+
+    stream = IncidentEventStream()
+    for _ in range(4):
+        await stream.emit("sess-1", EVENT_ENRICHING)
+    await stream.emit("sess-1", EVENT_RESOLVED)
+
+    batches = [
+        batch
+        async for batch in stream.subscribe_batched("sess-1", window=0.05, max_batch=2)
+    ]
+    assert [len(b) for b in batches] == [2, 2, 1]
+    assert batches[-1][0].event_type == EVENT_RESOLVED
+
+    # Replay stops at the first terminal event, even mid-batch
+    await stream.emit("sess-2", EVENT_ENRICHING)
+    await stream.emit("sess-2", EVENT_RESOLVED)
+    await stream.emit("sess-2", EVENT_ENRICHING)
+    batches = [
+        batch
+        async for batch in stream.subscribe_batched("sess-2", window=0.05, max_batch=4)
+    ]
+    assert [[e.event_type for e in b] for b in batches] == [[EVENT_ENRICHING, EVENT_RESOLVED]]
+
+
+@pytest.mark.asyncio
+async def test_batched_subscription_without_history():
+    """With no history retained, batched subscribers skip rather than crash."""
+    from incident_response.streaming import EVENT_ENRICHING, IncidentEventStream
+
+    stream = IncidentEventStream(max_history=0)
+
+    async def consume():
+        return [
+            batch
+            async for batch in stream.subscribe_batched("sess-1", window=0.01, max_batch=4)
+        ]
+
+    consumer = asyncio.ensure_future(consume())
+    await asyncio.sleep(0)
+    await stream.emit("sess-1", EVENT_ENRICHING)
+    await asyncio.sleep(0.02)
+    stream.close("sess-1")
+    assert await asyncio.wait_for(consumer, timeout=1) == []
+
+
+def test_alert_service_and_source_are_interned():
+    """Alerts naming the same service share one string object."""
+    from incident_response.models import Alert
+
+    def fresh(text: str) -> str:
+        return "".join(list(text))
+
+    first = Alert(
+        id="A-1", source=fresh("api"), title="t", description="d", service=fresh("db-proxy")
+    )
+    second = Alert(
+        id="A-2", source=fresh("api"), title="t", description="d", service=fresh("db-proxy")
+    )
+    assert first.service is second.service
+    assert first.source is second.source
+
+
+@pytest.mark.asyncio
+async def test_kubectl_exec_matches_pods_and_returns_copies():
+    """Any command mentioning pods gets the pod listing, as a fresh dict."""
+    from incident_response.tools.infrastructure import kubectl_exec
+
+    listing = await kubectl_exec("get pods,svc -n payments")
+    assert "CrashLoopBackOff" in listing["output"]
+
+    listing["output"] = "corrupted"
+    again = await kubectl_exec("get pods")
+    assert "CrashLoopBackOff" in again["output"]
+
+
+def test_service_indexes_match_registry():
+    """Tier, team and dependents indexes agree with a scan of the service registry."""
+    from incident_response.mock_data.infrastructure import (
+        SERVICE_REGISTRY,
+        get_dependents,
+        get_services_by_team,
+        get_services_by_tier,
+    )
+
+    for name, info in SERVICE_REGISTRY.items():
+        assert name in get_services_by_tier(info["tier"])
+        assert name in get_services_by_team(info["owner_team"])
+        for dependency in info["dependencies"]:
+            assert name in get_dependents(dependency)
+    assert get_services_by_tier("nonexistent") == ()
+
+
+@pytest.mark.asyncio
+async def test_event_history_keeps_most_recent_events():
+    """Replay history is capped at max_history, dropping the oldest events."""
+    from incident_response.streaming import EVENT_ENRICHING, IncidentEventStream
+
+    stream = IncidentEventStream(max_history=3)
+    for n in range(5):
+        await stream.emit("sess-1", EVENT_ENRICHING, message=str(n))
+
+    assert [e.message for e in stream.get_history("sess-1")] == ["2", "3", "4"]
+
+
+@pytest.mark.asyncio
+async def test_subscribers_share_one_event_log():
+    """Concurrent and late subscribers all read the same events from one log."""
+    from incident_response.streaming import (
+        EVENT_ENRICHING,
+        EVENT_RESOLVED,
+        IncidentEventStream,
+    )
+
+    stream = IncidentEventStream()
+
+    async def collect() -> list[str]:
+        return [e.event_type async for e in stream.subscribe("sess-1")]
+
+    live = [asyncio.ensure_future(collect()) for _ in range(3)]
+    await asyncio.sleep(0)
+    await stream.emit("sess-1", EVENT_ENRICHING)
+    await stream.emit("sess-1", EVENT_RESOLVED)
+
+    expected = [EVENT_ENRICHING, EVENT_RESOLVED]
+    assert await asyncio.gather(*live) == [expected] * 3
+    # A late joiner replays the retained log and stops at the terminal event
+    assert await collect() == expected